@@ -11,6 +11,9 @@ echo "PostgreSQL is ready!"
 echo "Running database migrations..."
 python manage.py migrate --noinput
 
+# Create the shared cache table (rate-limit state)
+python manage.py createcachetable
+
 # Create superuser if it doesn't exist (optional, for admin access)
 echo "Checking for superuser..."
 python manage.py shell -c "
@@ -23,6 +26,6 @@ else:
     print('Superuser already exists');
 " || true
 
-# Start Django development server
+# Start gunicorn; its post_worker_init hook warms up the LLM classifier in each worker
 echo "Starting Django server..."
-python manage.py runserver 0.0.0.0:8000
+exec gunicorn -c gunicorn.conf.py support_ticket_system.wsgi
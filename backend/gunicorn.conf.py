@@ -0,0 +1,26 @@
+"""
+Gunicorn configuration for the backend.
+
+Usage:
+    gunicorn -c gunicorn.conf.py support_ticket_system.wsgi
+
+The LLM classifier is warmed up in post_worker_init, which runs in each worker
+after fork whether or not --preload is used. Building the client in the
+master instead would share its connections across forked workers.
+"""
+
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('GUNICORN_WORKERS', '2'))
+# Also read by settings.WORKER_THREADS to size the classify admission queue
+threads = int(os.getenv('GUNICORN_THREADS', '16'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+# Restart workers when code changes (docker-compose mounts the source for development)
+reload = os.getenv('GUNICORN_RELOAD', 'False').lower() in ('1', 'true', 'yes')
+
+
+def post_worker_init(worker):
+    """Build the LLM classifier before this worker takes its first request."""
+    from tickets.services.llm_classifier import warm_up
+    warm_up()
@@ -12,6 +12,8 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 
 from pathlib import Path
 import os
+from importlib.util import find_spec
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -51,6 +53,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',  # CORS must be before CommonMiddleware
+    'tickets.middleware.CompressionMiddleware',  # gzip/Brotli; before anything that touches the body
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -95,6 +98,36 @@ DATABASES = {
 }
 
 
+# Cache
+# Shared by all workers (holds rate-limit state). Redis when REDIS_URL is set.
+
+REDIS_URL = os.getenv('REDIS_URL', '')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    # Fallback: database table created with `manage.py createcachetable`.
+    # Every add()/set() runs COUNT(*) over the table, and past MAX_ENTRIES a
+    # cull deletes 1/CULL_FREQUENCY of the rows by key order, which resets any
+    # rate-limit buckets it removes. MAX_ENTRIES is sized well above one state
+    # row plus one lock row per active client; use Redis under real load.
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+            'OPTIONS': {
+                'MAX_ENTRIES': 100000,
+                'CULL_FREQUENCY': 10,
+            },
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -138,17 +171,59 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST Framework settings
 REST_FRAMEWORK = {
-    'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-    ],
-    'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
-    ],
+    'DEFAULT_RENDERER_CLASSES': ['tickets.renderers.ORJSONRenderer'],
+    'DEFAULT_PARSER_CLASSES': ['tickets.parsers.ORJSONParser'],
 }
 
+# MessagePack is optional: without the package, Accept: application/msgpack
+# falls back to JSON (or 406) instead of failing in the renderer
+if find_spec('msgpack') is not None:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append('tickets.renderers.MessagePackRenderer')
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'].append('tickets.parsers.MessagePackParser')
+
+# Ticket list totals (see tickets.services.counting): exact, estimate, capped or auto
+TICKET_COUNT_STRATEGY = os.getenv('TICKET_COUNT_STRATEGY', 'auto')
+TICKET_COUNT_EXACT_THRESHOLD = int(os.getenv('TICKET_COUNT_EXACT_THRESHOLD', '10000'))
+TICKET_COUNT_CAP = int(os.getenv('TICKET_COUNT_CAP', '10000'))
+
+# Responses smaller than this are sent uncompressed
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv('RESPONSE_COMPRESSION_MIN_BYTES', '1024'))
+
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = True  # For development; restrict in production
 CORS_ALLOW_CREDENTIALS = True
+CORS_ALLOW_HEADERS = (*default_headers, 'x-request-priority')
 
 # Gemini API Configuration
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
+
+# LLM classifier backend (dotted path) and whether workers construct it at boot
+LLM_CLASSIFIER_BACKEND = os.getenv('LLM_CLASSIFIER_BACKEND', 'tickets.services.llm_classifier.LLMClassifier')
+LLM_WARMUP = os.getenv('LLM_WARMUP', 'True').lower() in ('1', 'true', 'yes')
+
+# Classify endpoint load protection
+# Per-client token bucket (shared across workers through the cache)
+CLASSIFY_RATE_LIMIT_BACKEND = os.getenv('CLASSIFY_RATE_LIMIT_BACKEND', 'tickets.throttling.CacheTokenBucketStore')
+CLASSIFY_RATE_LIMIT_RATE = float(os.getenv('CLASSIFY_RATE_LIMIT_RATE', '1'))  # tokens per second
+CLASSIFY_RATE_LIMIT_BURST = int(os.getenv('CLASSIFY_RATE_LIMIT_BURST', '10'))
+# Per-worker admission queue in front of the LLM call. Running and queued
+# classify calls each hold a worker thread, so by default they share half of
+# the worker's threads and the other half always serves the rest of the API.
+# WORKER_THREADS must match the server (gunicorn.conf.py reads the same variable).
+WORKER_THREADS = int(os.getenv('GUNICORN_THREADS', '16'))
+_classify_threads = max(1, WORKER_THREADS // 2)
+CLASSIFY_MAX_CONCURRENT = int(os.getenv('CLASSIFY_MAX_CONCURRENT', max(1, _classify_threads // 2)))
+CLASSIFY_MAX_QUEUED_BATCH = int(os.getenv(
+    'CLASSIFY_MAX_QUEUED_BATCH',
+    max(0, _classify_threads - CLASSIFY_MAX_CONCURRENT) // 4,
+))
+CLASSIFY_MAX_QUEUED_INTERACTIVE = int(os.getenv(
+    'CLASSIFY_MAX_QUEUED_INTERACTIVE',
+    max(0, _classify_threads - CLASSIFY_MAX_CONCURRENT - CLASSIFY_MAX_QUEUED_BATCH),
+))
+CLASSIFY_QUEUE_TIMEOUT = float(os.getenv('CLASSIFY_QUEUE_TIMEOUT', '5'))  # seconds
+
+# Similar-ticket vector index (memory-mapped float32 matrix, one row per ticket).
+# The dimension count is added to the file name, e.g. ticket_vectors.256d.f32.
+TICKET_VECTOR_INDEX_PATH = Path(os.getenv('TICKET_VECTOR_INDEX_PATH', BASE_DIR / 'var' / 'ticket_vectors.f32'))
+TICKET_VECTOR_DIMENSIONS = int(os.getenv('TICKET_VECTOR_DIMENSIONS', '256'))
@@ -0,0 +1,31 @@
+"""
+System checks for settings that must fit together.
+"""
+
+from django.conf import settings
+from django.core.checks import Error, register
+
+
+@register()
+def check_classify_thread_budget(app_configs, **kwargs):
+    """
+    Running and queued classify calls each hold a worker thread. If they can
+    take every thread, slow LLM calls starve the rest of the API and the
+    admission queue never fills, so it never sheds load.
+    """
+    classify_threads = (
+        settings.CLASSIFY_MAX_CONCURRENT
+        + settings.CLASSIFY_MAX_QUEUED_INTERACTIVE
+        + settings.CLASSIFY_MAX_QUEUED_BATCH
+    )
+    if classify_threads < settings.WORKER_THREADS:
+        return []
+    return [
+        Error(
+            f"Classify calls can hold {classify_threads} threads but workers only have "
+            f"{settings.WORKER_THREADS}.",
+            hint="Lower CLASSIFY_MAX_CONCURRENT and the CLASSIFY_MAX_QUEUED_* settings, "
+                 "or raise GUNICORN_THREADS.",
+            id='tickets.E001',
+        )
+    ]
@@ -0,0 +1,30 @@
+"""
+Ticket list filters, shared by the list endpoint and its facet counts.
+"""
+
+from typing import Mapping, Optional
+
+from django.db.models import Q
+
+# Query parameters that filter the list by exact field value
+FILTER_FIELDS = ['category', 'priority', 'status']
+
+
+def filter_tickets(queryset, filters: Mapping[str, str], search: Optional[str] = None):
+    """
+    Apply the ticket list filters to a queryset.
+
+    Args:
+        filters: Field values keyed by name (e.g. request.query_params);
+            missing or empty values are ignored
+        search: Optional term matched case-insensitively against title and description
+    """
+    for field in FILTER_FIELDS:
+        value = filters.get(field)
+        if value:
+            queryset = queryset.filter(**{field: value})
+
+    if search:
+        queryset = queryset.filter(Q(title__icontains=search) | Q(description__icontains=search))
+
+    return queryset
@@ -0,0 +1,83 @@
+"""
+Backfill MinHash signatures and LSH buckets for existing tickets.
+
+Usage:
+    python manage.py backfill_minhash [--batch-size 500] [--link-duplicates] [--all]
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from tickets.models import Ticket, TicketLSHBucket
+from tickets.services.duplicates import band_buckets, compute_signature, find_duplicate_of
+
+
+class Command(BaseCommand):
+    help = "Compute MinHash signatures and LSH buckets for tickets that do not have them yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help="Number of tickets processed per transaction (default: 500)",
+        )
+        parser.add_argument(
+            '--link-duplicates',
+            action='store_true',
+            help="Also flag each ticket as a duplicate of an earlier near-identical ticket",
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help="Recompute signatures for every ticket, not only those missing one",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        link_duplicates = options['link_duplicates']
+
+        queryset = Ticket.objects.only('id', 'description', 'duplicate_of')
+        if not options['all']:
+            queryset = queryset.filter(minhash_signature__isnull=True)
+
+        # Oldest first, so duplicates point at the original report
+        last_id = 0
+        processed = 0
+        flagged = 0
+        while True:
+            batch = list(queryset.filter(id__gt=last_id).order_by('id')[:batch_size])
+            if not batch:
+                break
+
+            with transaction.atomic():
+                buckets = []
+                for ticket in batch:
+                    ticket.minhash_signature = compute_signature(ticket.description)
+                    if ticket.minhash_signature:
+                        buckets.extend(
+                            TicketLSHBucket(ticket=ticket, band=band, bucket_hash=bucket_hash)
+                            for band, bucket_hash in band_buckets(ticket.minhash_signature)
+                        )
+
+                Ticket.objects.bulk_update(batch, ['minhash_signature'])
+                TicketLSHBucket.objects.filter(ticket__in=batch).delete()
+                TicketLSHBucket.objects.bulk_create(buckets)
+
+                if link_duplicates:
+                    for ticket in batch:
+                        if ticket.duplicate_of_id:
+                            continue
+                        original = find_duplicate_of(ticket.minhash_signature, exclude_id=ticket.pk)
+                        if original and original.pk < ticket.pk:
+                            Ticket.objects.filter(pk=ticket.pk).update(duplicate_of=original)
+                            flagged += 1
+
+            processed += len(batch)
+            last_id = batch[-1].id
+            self.stdout.write(f"Indexed {processed} tickets...")
+
+        summary = f"Backfilled MinHash signatures for {processed} tickets."
+        if link_duplicates:
+            summary += f" Flagged {flagged} duplicates."
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,95 @@
+"""
+Benchmark response renderers and compression on a synthetic ticket list.
+
+Usage:
+    python manage.py benchmark_renderers [--tickets 10000] [--repeat 5]
+"""
+
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from tickets.middleware import BROTLI_AVAILABLE, compress
+from tickets.models import Ticket
+from tickets.renderers import MSGPACK_AVAILABLE, ORJSONRenderer, MessagePackRenderer
+
+WORDS = (
+    "cannot access account login password vpn error payment invoice refund "
+    "dashboard slow timeout broken page export report crash sync mobile app"
+).split()
+
+
+class Command(BaseCommand):
+    help = "Compare render time and bytes on the wire for a large ticket list payload."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tickets',
+            type=int,
+            default=10000,
+            help="Number of tickets in the payload (default: 10000)",
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help="Timing repetitions; the best run is reported (default: 5)",
+        )
+
+    def handle(self, *args, **options):
+        payload = self.build_payload(options['tickets'])
+        repeat = options['repeat']
+
+        renderers = [('JSONRenderer (stdlib)', JSONRenderer()), ('ORJSONRenderer', ORJSONRenderer())]
+        if MSGPACK_AVAILABLE:
+            renderers.append(('MessagePackRenderer', MessagePackRenderer()))
+
+        encodings = ['gzip'] + (['br'] if BROTLI_AVAILABLE else [])
+
+        self.stdout.write(f"Payload: {len(payload)} tickets, best of {repeat} runs\n")
+        header = f"{'Renderer':<24}{'Encoding':<10}{'Bytes':>12}{'Render ms':>12}{'Compress ms':>14}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+
+        for name, renderer in renderers:
+            body, render_ms = self.best_of(repeat, lambda: renderer.render(payload))
+            self.stdout.write(f"{name:<24}{'identity':<10}{len(body):>12,}{render_ms:>12.1f}{'-':>14}")
+            for encoding in encodings:
+                compressed, compress_ms = self.best_of(repeat, lambda: compress(body, encoding))
+                self.stdout.write(
+                    f"{name:<24}{encoding:<10}{len(compressed):>12,}{render_ms:>12.1f}{compress_ms:>14.1f}"
+                )
+
+    def build_payload(self, count):
+        """Build serialized-ticket dicts shaped like TicketSerializer output."""
+        rng = random.Random(42)
+        now = timezone.now()
+        categories = [choice for choice, _ in Ticket.CATEGORY_CHOICES]
+        priorities = [choice for choice, _ in Ticket.PRIORITY_CHOICES]
+        statuses = [choice for choice, _ in Ticket.STATUS_CHOICES]
+        return [
+            {
+                'id': index + 1,
+                'title': ' '.join(rng.choices(WORDS, k=6)).capitalize(),
+                'description': ' '.join(rng.choices(WORDS, k=rng.randint(20, 80))).capitalize() + '.',
+                'category': rng.choice(categories),
+                'priority': rng.choice(priorities),
+                'status': rng.choice(statuses),
+                'created_at': (now - timedelta(minutes=index)).isoformat(),
+                'duplicate_of': None,
+            }
+            for index in range(count)
+        ]
+
+    def best_of(self, repeat, func):
+        """Run func repeat times; return its result and the fastest time in ms."""
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+        return result, best * 1000
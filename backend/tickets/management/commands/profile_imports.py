@@ -0,0 +1,104 @@
+"""
+Report import-time cost of backend modules.
+
+Runs each target in a fresh interpreter with `python -X importtime`, so the
+numbers reflect a cold start (as seen by a new worker or management command).
+
+Usage:
+    python manage.py profile_imports [module ...] [--top 15]
+"""
+
+import os
+import re
+import subprocess
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+DEFAULT_TARGETS = [
+    'support_ticket_system.urls',
+    'tickets.services.llm_classifier',
+    'tickets.services.vector_index',
+    'support_ticket_system.wsgi',
+]
+
+_MARKER = '-- profile_imports start --'
+_IMPORTTIME_RE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+class Command(BaseCommand):
+    help = "Measure cold-start import time of backend modules (after django.setup())."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'modules',
+            nargs='*',
+            help=f"Modules to import (default: {', '.join(DEFAULT_TARGETS)})",
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=15,
+            help="Number of slowest top-level imports to list per target (default: 15)",
+        )
+
+    def handle(self, *args, **options):
+        baseline_ms, _ = self.profile(None)
+        self.stdout.write(f"django.setup() baseline: {baseline_ms:.0f} ms\n")
+
+        for target in options['modules'] or DEFAULT_TARGETS:
+            wall_ms, imports = self.profile(target)
+            if imports is None:
+                self.stdout.write(self.style.ERROR(f"{target}: import failed"))
+                continue
+
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{target}: {wall_ms:.0f} ms wall, +{wall_ms - baseline_ms:.0f} ms over baseline"
+            ))
+            for cumulative_us, module in imports[:options['top']]:
+                self.stdout.write(f"  {cumulative_us / 1000:>8.1f} ms  {module}")
+            self.stdout.write('')
+
+    def profile(self, target):
+        """
+        Import target after django.setup() in a subprocess.
+
+        Returns:
+            (wall time in ms, [(cumulative_us, module)] for the target and
+            its direct imports, slowest first), or None for the import list
+            if the subprocess failed
+        """
+        # The marker separates Django's own startup imports from the target's
+        code = f'import django, sys; django.setup(); sys.stderr.write({_MARKER!r} + "\\n")'
+        if target:
+            # A plain import statement: importlib.import_module() is not timed by -X importtime
+            code += f'; import {target}'
+
+        env = dict(os.environ)
+        env.setdefault('DJANGO_SETTINGS_MODULE', 'support_ticket_system.settings')
+
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            errors = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+            if errors:
+                self.stderr.write(errors[-1])
+            return wall_ms, None
+
+        imports = []
+        lines = result.stderr.splitlines()
+        for line in lines[lines.index(_MARKER) + 1:] if _MARKER in lines else []:
+            match = _IMPORTTIME_RE.match(line)
+            # Keep the target and the modules it imports directly (one indent level)
+            if match and len(match.group(3)) <= 3:
+                imports.append((int(match.group(2)), match.group(4)))
+
+        imports.sort(reverse=True)
+        return wall_ms, imports
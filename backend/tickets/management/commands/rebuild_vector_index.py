@@ -0,0 +1,109 @@
+"""
+Rebuild the similar-ticket vector index and report its memory footprint.
+
+Usage:
+    python manage.py rebuild_vector_index [--batch-size 2000] [--report-only]
+
+Workers keep writing to the live index while the new file is built. After
+the swap, tickets created during the rebuild are embedded again and rows of
+tickets deleted during it are cleared. An edit to an existing ticket that
+lands between its batch being read and the swap is not replayed (there is no
+modification timestamp to find it by); it is picked up on the ticket's next
+update or the next rebuild.
+"""
+
+import os
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from tickets.models import Ticket
+from tickets.services.vector_index import VectorIndex, embed, get_vector_index
+
+
+class Command(BaseCommand):
+    help = "Recompute every ticket embedding into a fresh vector index file."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help="Number of tickets embedded per batch (default: 2000)",
+        )
+        parser.add_argument(
+            '--report-only',
+            action='store_true',
+            help="Only print the memory footprint of the current index",
+        )
+
+    def handle(self, *args, **options):
+        index = get_vector_index()
+
+        if not options['report_only']:
+            self.rebuild(index, options['batch_size'])
+
+        footprint = index.memory_footprint()
+        self.stdout.write(f"Index file:       {footprint['path']}")
+        self.stdout.write(f"Dimensions:       {footprint['dimensions']}")
+        self.stdout.write(f"Indexed tickets:  {footprint['indexed_rows']}")
+        self.stdout.write(f"Allocated rows:   {footprint['capacity_rows']}")
+        self.stdout.write(f"Bytes per ticket: {footprint['bytes_per_ticket']}")
+        self.stdout.write(f"Size on disk:     {footprint['bytes_on_disk'] / 1024 ** 2:.1f} MiB")
+
+    def rebuild(self, index: VectorIndex, batch_size: int):
+        """Write all embeddings to a temporary file, then swap it into place."""
+        temp = VectorIndex(index.path.with_suffix('.rebuild'), index.dimensions)
+        if temp.path.exists():
+            temp.path.unlink()
+
+        processed, last_id = self.embed_tickets(temp, 0, batch_size)
+
+        if processed:
+            # Atomic rename: workers remap the new file on their next query
+            os.replace(temp.path, index.path)
+        elif index.path.exists():
+            index.path.unlink()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt vector index for {processed} tickets."))
+
+        # Workers wrote creates and deletes made during the rebuild to the old file
+        replayed, _ = self.embed_tickets(index, last_id, batch_size)
+        cleared = self.clear_deleted(index, last_id)
+        if replayed or cleared:
+            self.stdout.write(f"Replayed {replayed} new and {cleared} deleted tickets from during the rebuild.")
+
+    def embed_tickets(self, index: VectorIndex, after_id: int, batch_size: int):
+        """
+        Embed every ticket with id > after_id into the index.
+
+        Returns:
+            (tickets embedded, highest id embedded)
+        """
+        last_id = after_id
+        processed = 0
+        queryset = Ticket.objects.only('id', 'title', 'description').order_by('id')
+        while True:
+            batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+
+            index.upsert(batch[-1].id, np.zeros(index.dimensions, dtype=np.float32))
+            matrix = index.matrix()
+            for ticket in batch:
+                matrix[ticket.id] = embed(ticket.title, ticket.description, index.dimensions)
+            matrix.flush()
+
+            processed += len(batch)
+            last_id = batch[-1].id
+            self.stdout.write(f"Embedded {processed} tickets...")
+        return processed, last_id
+
+    def clear_deleted(self, index: VectorIndex, up_to_id: int) -> int:
+        """Zero the rows of tickets up to up_to_id that no longer exist."""
+        matrix = index.matrix()
+        rows = np.flatnonzero(matrix[:up_to_id + 1].any(axis=1))
+        existing = set(Ticket.objects.filter(id__lte=up_to_id).values_list('id', flat=True))
+        stale = [int(row) for row in rows if int(row) not in existing]
+        for ticket_id in stale:
+            index.remove(ticket_id)
+        return len(stale)
@@ -0,0 +1,42 @@
+# Generated by Django 5.0.1 on 2026-10-19 10:26
+
+from django.db import migrations, models
+from django.db.models import Case, FloatField, Value, When
+from django.db.models.functions import Extract
+
+
+def backfill_urgency_score(apps, schema_editor):
+    """Compute urgency_score for existing tickets in a single UPDATE."""
+    Ticket = apps.get_model('tickets', 'Ticket')
+    hours_per_priority = 24
+    rank = Case(
+        *[
+            When(priority=priority, then=Value(float(index * hours_per_priority)))
+            for index, priority in enumerate(['low', 'medium', 'high', 'critical'])
+        ],
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+    Ticket.objects.update(
+        urgency_score=rank - Extract('created_at', 'epoch', output_field=FloatField()) / Value(3600.0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='urgency_score',
+            field=models.FloatField(default=0.0, editable=False, help_text='Precomputed urgency (priority rank plus age) used to order the work queue'),
+        ),
+        migrations.RunPython(backfill_urgency_score, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(condition=models.Q(('status', 'open')), fields=['-urgency_score'], name='tickets_open_urgency_idx'),
+        ),
+    ]
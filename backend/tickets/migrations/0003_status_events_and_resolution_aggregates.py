@@ -0,0 +1,52 @@
+# Generated by Django 5.0.1 on 2026-10-19 10:26
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0002_ticket_urgency_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResolutionAggregate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(choices=[('resolution', 'Time to resolve'), ('in_progress', 'Time in progress')], help_text='Duration being measured', max_length=20)),
+                ('dimension', models.CharField(choices=[('category', 'Category'), ('priority', 'Priority')], help_text='Ticket field the aggregate is grouped by', max_length=20)),
+                ('value', models.CharField(help_text="Value of the dimension (e.g. 'billing' or 'high')", max_length=20)),
+                ('count', models.BigIntegerField(default=0, help_text='Number of recorded durations')),
+                ('total_seconds', models.FloatField(default=0.0, help_text='Sum of recorded durations in seconds')),
+                ('sketch', models.JSONField(default=dict, help_text='Log-bucketed histogram for streaming percentile estimates')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TicketStatusEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(choices=[('open', 'Open'), ('in_progress', 'In Progress'), ('resolved', 'Resolved'), ('closed', 'Closed')], help_text='Status before the change', max_length=20)),
+                ('to_status', models.CharField(choices=[('open', 'Open'), ('in_progress', 'In Progress'), ('resolved', 'Resolved'), ('closed', 'Closed')], help_text='Status after the change', max_length=20)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Timestamp of the status change')),
+            ],
+            options={
+                'ordering': ['-changed_at'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='resolutionaggregate',
+            constraint=models.UniqueConstraint(fields=('metric', 'dimension', 'value'), name='tickets_resolution_aggregate_unique'),
+        ),
+        migrations.AddField(
+            model_name='ticketstatusevent',
+            name='ticket',
+            field=models.ForeignKey(help_text='Ticket whose status changed', on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='tickets.ticket'),
+        ),
+        migrations.AddIndex(
+            model_name='ticketstatusevent',
+            index=models.Index(fields=['ticket', '-changed_at'], name='tickets_tic_ticket__8fbb30_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.1 on 2026-10-19 10:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0003_status_events_and_resolution_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, help_text='Earlier ticket this one was flagged as a near-duplicate of', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='tickets.ticket'),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='minhash_signature',
+            field=models.BinaryField(blank=True, help_text='MinHash signature of the description, used for near-duplicate detection', null=True),
+        ),
+        migrations.CreateModel(
+            name='TicketLSHBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('band', models.PositiveSmallIntegerField(help_text='Index of the signature band')),
+                ('bucket_hash', models.BigIntegerField(help_text='Hash of the signature values in this band')),
+                ('ticket', models.ForeignKey(help_text='Ticket whose signature falls in this bucket', on_delete=django.db.models.deletion.CASCADE, related_name='lsh_buckets', to='tickets.ticket')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['band', 'bucket_hash'], name='tickets_tic_band_f5ae73_idx')],
+            },
+        ),
+    ]
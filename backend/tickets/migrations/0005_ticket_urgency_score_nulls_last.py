@@ -0,0 +1,26 @@
+# Generated by Django 5.0.1 on 2026-10-19 10:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0004_ticket_minhash_duplicates'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='ticket',
+            name='tickets_open_urgency_idx',
+        ),
+        migrations.AlterField(
+            model_name='ticket',
+            name='urgency_score',
+            field=models.FloatField(editable=False, help_text='Precomputed urgency (priority rank plus age) used to order the work queue', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(models.OrderBy(models.F('urgency_score'), descending=True, nulls_last=True), condition=models.Q(('status', 'open')), name='tickets_open_urgency_idx'),
+        ),
+    ]
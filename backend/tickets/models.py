@@ -1,7 +1,39 @@
 from django.db import models
+from django.db.models import Case, F, FloatField, Value, When
+from django.db.models.functions import Extract
+from django.db.models.lookups import Exact
 from django.utils import timezone
 
 
+class TicketQuerySet(models.QuerySet):
+    """
+    Keeps urgency_score in sync for writes that bypass Ticket.save().
+    
+    Rows written any other way (loaddata, raw SQL) have a NULL score and sort
+    after every scored ticket in the work queue.
+    """
+    
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        now = timezone.now()
+        for obj in objs:
+            obj.urgency_score = Ticket.urgency_for(obj.priority, obj.created_at or now)
+        return super().bulk_create(objs, *args, **kwargs)
+    
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        if 'priority' in fields:
+            objs = list(objs)
+            for obj in objs:
+                obj.urgency_score = Ticket.urgency_for(obj.priority, obj.created_at)
+            fields = list(fields) + ['urgency_score']
+        return super().bulk_update(objs, fields, *args, **kwargs)
+    
+    def update(self, **kwargs):
+        if 'priority' in kwargs:
+            kwargs['urgency_score'] = Ticket.urgency_expression(kwargs['priority'])
+        return super().update(**kwargs)
+
+
 class Ticket(models.Model):
     """
     Support Ticket model with LLM-suggested categorization and priority.
@@ -80,6 +112,36 @@ class Ticket(models.Model):
         help_text="Timestamp when the ticket was created"
     )
     
+    urgency_score = models.FloatField(
+        null=True,
+        editable=False,
+        help_text="Precomputed urgency (priority rank plus age) used to order the work queue"
+    )
+    
+    minhash_signature = models.BinaryField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="MinHash signature of the description, used for near-duplicate detection"
+    )
+    
+    duplicate_of = models.ForeignKey(
+        'self',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='duplicates',
+        help_text="Earlier ticket this one was flagged as a near-duplicate of"
+    )
+    
+    objects = TicketQuerySet.as_manager()
+    
+    # Hours of waiting time one priority step is worth in the urgency score
+    URGENCY_HOURS_PER_PRIORITY = 24
+    
+    # Work queue order: most urgent first, unscored rows last
+    URGENCY_ORDERING = F('urgency_score').desc(nulls_last=True)
+    
     class Meta:
         ordering = ['-created_at']  # Newest first
         indexes = [
@@ -87,7 +149,191 @@ class Ticket(models.Model):
             models.Index(fields=['category']),
             models.Index(fields=['priority']),
             models.Index(fields=['status']),
+            # Work queue: only open tickets, most urgent first (matches URGENCY_ORDERING)
+            models.Index(
+                F('urgency_score').desc(nulls_last=True),
+                name='tickets_open_urgency_idx',
+                condition=models.Q(status='open'),
+            ),
         ]
     
     def __str__(self):
         return f"#{self.pk} - {self.title}"
+    
+    @classmethod
+    def urgency_for(cls, priority, created_at):
+        """
+        Compute the urgency score for a priority and creation time.
+        
+        Urgency is priority rank (in hours) plus age in hours. Age grows at the
+        same rate for every ticket, so the current time is dropped and the score
+        only changes when the priority does: ordering by it at any moment is the
+        same as ordering by rank + age.
+        """
+        priorities = [choice for choice, _ in cls.PRIORITY_CHOICES]
+        rank = priorities.index(priority) if priority in priorities else 0
+        return rank * cls.URGENCY_HOURS_PER_PRIORITY - created_at.timestamp() / 3600
+    
+    @classmethod
+    def urgency_expression(cls, priority):
+        """
+        SQL equivalent of urgency_for(), for a priority value or expression and
+        each row's created_at.
+        """
+        if not hasattr(priority, 'resolve_expression'):
+            priority = Value(priority)
+        rank = Case(
+            *[
+                When(Exact(priority, Value(choice)), then=Value(float(index * cls.URGENCY_HOURS_PER_PRIORITY)))
+                for index, (choice, _) in enumerate(cls.PRIORITY_CHOICES)
+            ],
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+        return rank - Extract('created_at', 'epoch', output_field=FloatField()) / Value(3600.0)
+    
+    def save(self, *args, **kwargs):
+        """Keep the urgency score in sync with priority and creation time."""
+        self.urgency_score = self.urgency_for(self.priority, self.created_at or timezone.now())
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'priority' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'urgency_score'}
+        super().save(*args, **kwargs)
+
+
+class TicketLSHBucket(models.Model):
+    """
+    LSH index entry: one row per (band, bucket) of a ticket's MinHash signature.
+    """
+    
+    ticket = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name='lsh_buckets',
+        help_text="Ticket whose signature falls in this bucket"
+    )
+    
+    band = models.PositiveSmallIntegerField(
+        help_text="Index of the signature band"
+    )
+    
+    bucket_hash = models.BigIntegerField(
+        help_text="Hash of the signature values in this band"
+    )
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['band', 'bucket_hash']),
+        ]
+    
+    def __str__(self):
+        return f"#{self.ticket_id} band {self.band}"
+
+
+class TicketStatusEvent(models.Model):
+    """
+    Append-only log of ticket status transitions.
+    """
+    
+    ticket = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name='status_events',
+        help_text="Ticket whose status changed"
+    )
+    
+    from_status = models.CharField(
+        max_length=20,
+        choices=Ticket.STATUS_CHOICES,
+        help_text="Status before the change"
+    )
+    
+    to_status = models.CharField(
+        max_length=20,
+        choices=Ticket.STATUS_CHOICES,
+        help_text="Status after the change"
+    )
+    
+    changed_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="Timestamp of the status change"
+    )
+    
+    class Meta:
+        ordering = ['-changed_at']
+        indexes = [
+            models.Index(fields=['ticket', '-changed_at']),
+        ]
+    
+    def __str__(self):
+        return f"#{self.ticket_id}: {self.from_status} -> {self.to_status}"
+
+
+class ResolutionAggregate(models.Model):
+    """
+    Running aggregate of a duration metric for one category or priority value.
+    
+    Updated at write time whenever a status change completes a duration, so
+    resolution metrics can be read without scanning the event log.
+    """
+    
+    # Metrics
+    METRIC_RESOLUTION = 'resolution'
+    METRIC_IN_PROGRESS = 'in_progress'
+    
+    METRIC_CHOICES = [
+        (METRIC_RESOLUTION, 'Time to resolve'),
+        (METRIC_IN_PROGRESS, 'Time in progress'),
+    ]
+    
+    # Dimensions
+    DIMENSION_CATEGORY = 'category'
+    DIMENSION_PRIORITY = 'priority'
+    
+    DIMENSION_CHOICES = [
+        (DIMENSION_CATEGORY, 'Category'),
+        (DIMENSION_PRIORITY, 'Priority'),
+    ]
+    
+    metric = models.CharField(
+        max_length=20,
+        choices=METRIC_CHOICES,
+        help_text="Duration being measured"
+    )
+    
+    dimension = models.CharField(
+        max_length=20,
+        choices=DIMENSION_CHOICES,
+        help_text="Ticket field the aggregate is grouped by"
+    )
+    
+    value = models.CharField(
+        max_length=20,
+        help_text="Value of the dimension (e.g. 'billing' or 'high')"
+    )
+    
+    count = models.BigIntegerField(
+        default=0,
+        help_text="Number of recorded durations"
+    )
+    
+    total_seconds = models.FloatField(
+        default=0.0,
+        help_text="Sum of recorded durations in seconds"
+    )
+    
+    sketch = models.JSONField(
+        default=dict,
+        help_text="Log-bucketed histogram for streaming percentile estimates"
+    )
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['metric', 'dimension', 'value'],
+                name='tickets_resolution_aggregate_unique',
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.metric} by {self.dimension}={self.value} (n={self.count})"
@@ -0,0 +1,78 @@
+"""
+Opt-in limit/offset pagination with a configurable total-count strategy.
+"""
+
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from .services.counting import STRATEGIES, count_queryset
+
+
+class TicketPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination whose total count need not be exact.
+    
+    Only active when ?limit= is given, so unpaginated list responses are
+    unchanged. ?count= selects the strategy (exact, estimate, capped or auto);
+    the response reports whether the count is exact. One extra row is
+    fetched to decide whether there is a next page, so paging works even
+    when the count is an estimate.
+    """
+    default_limit = None
+    max_limit = 1000
+    count_query_param = 'count'
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+        self.offset = self.get_offset(request)
+        
+        self.count, self.count_is_exact = count_queryset(queryset, self.get_count_strategy(request))
+        
+        page = list(queryset[self.offset:self.offset + self.limit + 1])
+        self.has_next = len(page) > self.limit
+        page = page[:self.limit]
+        
+        # Rows seen on this page correct an inexact count where it is known to be off.
+        # An empty page past the end says nothing about the total, so it is left alone.
+        seen = self.offset + len(page)
+        if not self.count_is_exact:
+            if not self.has_next and (page or self.offset == 0):
+                self.count, self.count_is_exact = seen, True
+            elif page and self.count < seen + int(self.has_next):
+                self.count = seen + int(self.has_next)
+        
+        return page
+    
+    def get_count_strategy(self, request):
+        """Read the count strategy from the query string, or use the default."""
+        strategy = request.query_params.get(self.count_query_param, settings.TICKET_COUNT_STRATEGY)
+        if strategy not in STRATEGIES:
+            raise ValidationError({self.count_query_param: [f"Must be one of: {', '.join(STRATEGIES)}."]})
+        return strategy
+    
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+    
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.count,
+            'count_is_exact': self.count_is_exact,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+    
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count_is_exact'] = {'type': 'boolean'}
+        return response_schema
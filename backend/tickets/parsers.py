@@ -0,0 +1,44 @@
+"""
+Request body parsers matching the renderers in tickets.renderers.
+"""
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from .renderers import MSGPACK_AVAILABLE, ORJSONRenderer, MessagePackRenderer
+
+if MSGPACK_AVAILABLE:
+    import msgpack
+
+
+class ORJSONParser(BaseParser):
+    """
+    JSON parser backed by orjson, a drop-in for DRF's JSONParser.
+    """
+    media_type = 'application/json'
+    renderer_class = ORJSONRenderer
+    
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Parse a UTF-8 JSON request body."""
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as e:
+            raise ParseError(f"JSON parse error - {e}")
+
+
+class MessagePackParser(BaseParser):
+    """
+    MessagePack parser for Content-Type: application/msgpack.
+    """
+    media_type = 'application/msgpack'
+    renderer_class = MessagePackRenderer
+    
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Parse a MessagePack request body."""
+        if not MSGPACK_AVAILABLE:
+            raise ParseError("MessagePack request bodies are not supported on this server.")
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (msgpack.UnpackException, ValueError) as e:
+            raise ParseError(f"MessagePack parse error - {e}")
@@ -0,0 +1,53 @@
+"""
+Fast response renderers: orjson for JSON and MessagePack as a binary option.
+
+The renderer is chosen by DRF content negotiation from the Accept header;
+clients that send no preference get JSON.
+"""
+
+import orjson
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Fallback for types orjson does not handle natively (Decimal, lazy strings, ...)
+_default = JSONEncoder().default
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson, a drop-in for DRF's JSONRenderer.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None  # orjson always emits UTF-8
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data into UTF-8 encoded JSON bytes."""
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack renderer, selected with Accept: application/msgpack.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data into MessagePack bytes."""
+        if not MSGPACK_AVAILABLE:
+            raise ImproperlyConfigured("msgpack package not installed. MessagePack responses are unavailable.")
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_default, use_bin_type=True)
@@ -8,8 +8,24 @@ class TicketSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = Ticket
-        fields = ['id', 'title', 'description', 'category', 'priority', 'status', 'created_at']
-        read_only_fields = ['id', 'created_at']
+        fields = ['id', 'title', 'description', 'category', 'priority', 'status', 'created_at', 'duplicate_of']
+        read_only_fields = ['id', 'created_at', 'duplicate_of']
+
+
+class DuplicateTicketSerializer(TicketSerializer):
+    """
+    Serializer for a near-duplicate match with its estimated similarity.
+    """
+    similarity = serializers.FloatField(read_only=True)
+    
+    class Meta(TicketSerializer.Meta):
+        fields = TicketSerializer.Meta.fields + ['similarity']
+
+
+class SimilarTicketSerializer(DuplicateTicketSerializer):
+    """
+    Serializer for a similar-ticket match with its cosine similarity.
+    """
 
 
 class TicketCreateSerializer(serializers.ModelSerializer):
@@ -73,3 +89,11 @@ class StatsSerializer(serializers.Serializer):
     avg_tickets_per_day = serializers.FloatField()
     priority_breakdown = serializers.DictField()
     category_breakdown = serializers.DictField()
+
+
+class ResolutionStatsSerializer(serializers.Serializer):
+    """
+    Serializer for resolution-time metrics.
+    """
+    resolution = serializers.DictField()
+    in_progress = serializers.DictField()
@@ -0,0 +1,133 @@
+"""
+Admission control for slow upstream calls (the LLM classifier).
+
+Each worker process admits at most `max_concurrent` calls at a time. Extra
+callers wait in a bounded queue, served in priority order: interactive
+requests (the ticket form) are always admitted before batch callers. When a
+lane's queue is full, or a caller waits longer than `timeout`, the call is
+shed immediately instead of tying up the worker.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+# Lanes, in priority order
+LANE_INTERACTIVE = 'interactive'
+LANE_BATCH = 'batch'
+
+LANES = [LANE_INTERACTIVE, LANE_BATCH]
+
+
+class AdmissionRejected(Exception):
+    """Raised when a call is shed; retry_after is a hint in seconds."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Bounded, priority-ordered admission queue in front of a concurrency limit.
+    """
+
+    def __init__(self, max_concurrent: int, max_queued: dict, timeout: float):
+        """
+        Args:
+            max_concurrent: Calls allowed to run at once
+            max_queued: Waiting callers allowed per lane, e.g. {'interactive': 16, 'batch': 4}
+            timeout: Seconds a caller may wait for a slot before being shed
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.timeout = timeout
+        self._condition = threading.Condition()
+        self._running = 0
+        self._waiting = []  # heap of (lane rank, arrival order)
+        self._queued = {lane: 0 for lane in LANES}
+        self._arrivals = itertools.count()
+
+    @contextmanager
+    def admit(self, lane: str = LANE_BATCH):
+        """
+        Hold a slot for the duration of the with-block.
+
+        Raises:
+            AdmissionRejected: if the lane's queue is full or the wait times out
+        """
+        self._acquire(lane)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _acquire(self, lane: str):
+        """Take a slot, waiting in the lane's queue if none is free."""
+        lane = lane if lane in self._queued else LANE_BATCH
+        with self._condition:
+            if self._running < self.max_concurrent and not self._waiting:
+                self._running += 1
+                return
+
+            if self._queued[lane] >= self.max_queued.get(lane, 0):
+                raise AdmissionRejected(f"{lane} queue is full", retry_after=self.timeout)
+
+            entry = (LANES.index(lane), next(self._arrivals))
+            heapq.heappush(self._waiting, entry)
+            self._queued[lane] += 1
+            deadline = time.monotonic() + self.timeout
+            try:
+                # Wait until a slot is free and this caller is at the head of the queue
+                while not (self._running < self.max_concurrent and self._waiting[0] == entry):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise AdmissionRejected(f"timed out waiting in {lane} queue", retry_after=self.timeout)
+                    self._condition.wait(remaining)
+                heapq.heappop(self._waiting)
+                self._running += 1
+            except AdmissionRejected:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                raise
+            finally:
+                self._queued[lane] -= 1
+                # The head of the queue may have changed
+                self._condition.notify_all()
+
+    def _release(self):
+        """Free a slot and wake waiters so the highest-priority one can take it."""
+        with self._condition:
+            self._running -= 1
+            self._condition.notify_all()
+
+    def snapshot(self) -> dict:
+        """Current in-flight and queued counts (for logging and tests)."""
+        with self._condition:
+            return {'running': self._running, 'queued': dict(self._queued)}
+
+
+# Singleton instance (per worker process)
+_controller_instance = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get or create the admission controller for classify calls in this process."""
+    global _controller_instance
+    with _controller_lock:
+        if _controller_instance is None:
+            _controller_instance = AdmissionController(
+                max_concurrent=settings.CLASSIFY_MAX_CONCURRENT,
+                max_queued={
+                    LANE_INTERACTIVE: settings.CLASSIFY_MAX_QUEUED_INTERACTIVE,
+                    LANE_BATCH: settings.CLASSIFY_MAX_QUEUED_BATCH,
+                },
+                timeout=settings.CLASSIFY_QUEUE_TIMEOUT,
+            )
+    return _controller_instance
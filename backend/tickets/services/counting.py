@@ -0,0 +1,91 @@
+"""
+Cheap total counts for large filtered querysets.
+
+An exact COUNT(*) under filters and search costs as much as the query itself
+on a large table. These strategies trade exactness for constant cost:
+
+- exact:    COUNT(*)
+- estimate: the planner's row estimate (pg_class.reltuples when unfiltered,
+            EXPLAIN otherwise)
+- capped:   COUNT(*) over at most COUNT_CAP + 1 rows
+- auto:     exact when the planner expects at most COUNT_EXACT_THRESHOLD rows,
+            otherwise the estimate
+"""
+
+import json
+import logging
+from typing import Tuple
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+STRATEGY_EXACT = 'exact'
+STRATEGY_ESTIMATE = 'estimate'
+STRATEGY_CAPPED = 'capped'
+STRATEGY_AUTO = 'auto'
+
+STRATEGIES = [STRATEGY_EXACT, STRATEGY_ESTIMATE, STRATEGY_CAPPED, STRATEGY_AUTO]
+
+
+def count_queryset(queryset, strategy: str) -> Tuple[int, bool]:
+    """
+    Count a queryset with the given strategy.
+
+    Returns:
+        (count, is_exact)
+    """
+    # Ordering never changes a count, and dropping it keeps the plan cheap
+    queryset = queryset.order_by()
+
+    if strategy == STRATEGY_EXACT:
+        return queryset.count(), True
+
+    if strategy == STRATEGY_CAPPED:
+        cap = settings.TICKET_COUNT_CAP
+        count = queryset[:cap + 1].count()
+        return (cap, False) if count > cap else (count, True)
+
+    estimate = estimate_count(queryset)
+    if estimate is None:
+        # No usable estimate: fall back to a count that is still bounded
+        return count_queryset(queryset, STRATEGY_CAPPED)
+
+    if strategy == STRATEGY_AUTO and estimate <= settings.TICKET_COUNT_EXACT_THRESHOLD:
+        return queryset.count(), True
+
+    return estimate, False
+
+
+def estimate_count(queryset):
+    """
+    Estimate the number of rows a queryset returns, without running it.
+
+    Returns:
+        Row estimate, or None if the planner statistics are unavailable
+    """
+    try:
+        if not queryset.query.where:
+            return _table_estimate(queryset)
+        plan = json.loads(queryset.explain(format='json'))
+        return int(plan[0]['Plan']['Plan Rows'])
+    except Exception as e:
+        logger.warning(f"Row estimate failed: {e}")
+        return None
+
+
+def _table_estimate(queryset):
+    """Row count estimate for a whole table from pg_class.reltuples."""
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+
+    # reltuples is -1 for a table that has never been vacuumed or analyzed
+    if row is None or row[0] < 0:
+        plan = json.loads(queryset.explain(format='json'))
+        return int(plan[0]['Plan']['Plan Rows'])
+    return row[0]
@@ -0,0 +1,195 @@
+"""
+Near-duplicate ticket detection using MinHash signatures and LSH buckets.
+
+Each description is reduced to a fixed-size MinHash signature whose agreement
+rate with another signature estimates the Jaccard similarity of their word
+shingles. The signature is split into bands; tickets that share any band
+bucket become candidates, so finding duplicates only touches the buckets of
+the new ticket instead of comparing against every row.
+"""
+
+import hashlib
+import random
+import re
+import struct
+import zlib
+from typing import List, Optional, Set, Tuple
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from ..models import Ticket, TicketLSHBucket
+
+# Signature layout: BANDS x ROWS_PER_BAND hash values.
+# With 32 bands of 4 rows, pairs above 0.7 similarity share a bucket with
+# probability > 0.999, while pairs below 0.3 rarely do.
+NUM_PERMUTATIONS = 128
+BANDS = 32
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+
+# Estimated Jaccard similarity at which a ticket counts as a duplicate
+DUPLICATE_THRESHOLD = 0.7
+
+# Words per shingle
+SHINGLE_SIZE = 2
+
+# Candidates compared per lookup (those sharing the most bands); bounds the cost
+# when many tickets share buckets
+MAX_CANDIDATES = 50
+
+# Shingles hashed per NumPy block; bounds memory for very long descriptions
+_SHINGLE_BLOCK = 4096
+
+_SIGNATURE_FORMAT = f'<{NUM_PERMUTATIONS}I'
+
+# Fixed seed so signatures stay comparable across processes and restarts.
+# Each permutation is a multiply-shift hash: the top 32 bits of a * x + b (mod 2**64).
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.getrandbits(64) | 1, _rng.getrandbits(64))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def shingles(text: str) -> Set[int]:
+    """Hash the lowercase word shingles of a text to 32-bit integers."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        grams = [' '.join(words)] if words else []
+    else:
+        grams = [' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    return {zlib.crc32(gram.encode('utf-8')) for gram in grams}
+
+
+def compute_signature(text: str) -> Optional[bytes]:
+    """
+    Compute the MinHash signature of a text.
+
+    All permutations are applied to a block of shingles at once with NumPy,
+    so the cost is a few vectorized passes rather than a Python loop over
+    permutations x shingles.
+
+    Returns:
+        NUM_PERMUTATIONS little-endian uint32 values packed into bytes,
+        or None if the text has no words
+    """
+    # Imported here: NumPy is a large share of startup time (see views.py)
+    import numpy as np
+
+    hashed = shingles(text)
+    if not hashed:
+        return None
+
+    values = np.fromiter(hashed, dtype=np.uint64, count=len(hashed))
+    a = np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)[:, None]
+    b = np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)[:, None]
+
+    signature = np.full(NUM_PERMUTATIONS, np.iinfo(np.uint64).max, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for start in range(0, len(values), _SHINGLE_BLOCK):
+            block = values[start:start + _SHINGLE_BLOCK][None, :]
+            # uint64 arithmetic wraps, which is the mod 2**64 of multiply-shift hashing
+            permuted = (a * block + b) >> np.uint64(32)
+            signature = np.minimum(signature, permuted.min(axis=1))
+
+    return signature.astype('<u4').tobytes()
+
+
+def similarity(signature_a: bytes, signature_b: bytes) -> float:
+    """Estimate Jaccard similarity as the fraction of matching MinHash values."""
+    values_a = struct.unpack(_SIGNATURE_FORMAT, bytes(signature_a))
+    values_b = struct.unpack(_SIGNATURE_FORMAT, bytes(signature_b))
+    return sum(a == b for a, b in zip(values_a, values_b)) / NUM_PERMUTATIONS
+
+
+def band_buckets(signature: bytes) -> List[Tuple[int, int]]:
+    """Split a signature into (band, bucket_hash) pairs for the LSH index."""
+    signature = bytes(signature)
+    band_bytes = ROWS_PER_BAND * 4
+    buckets = []
+    for band in range(BANDS):
+        chunk = signature[band * band_bytes:(band + 1) * band_bytes]
+        digest = hashlib.blake2b(chunk, digest_size=8).digest()
+        buckets.append((band, int.from_bytes(digest, 'little', signed=True)))
+    return buckets
+
+
+def find_duplicates(signature: Optional[bytes], exclude_id: Optional[int] = None,
+                    limit: Optional[int] = None, originals_only: bool = False) -> List[Tuple[Ticket, float]]:
+    """
+    Find tickets whose description is a near-duplicate of the signature.
+
+    Only tickets sharing at least one LSH bucket are compared, and only the
+    MAX_CANDIDATES that share the most bands. Unrelated tickets share a bucket
+    by chance far more often than they share several, so the real match is
+    not crowded out by chance collisions on a large table.
+
+    Args:
+        originals_only: Skip tickets already flagged as duplicates. In an
+            outage every copy shares the same buckets, so this keeps the
+            candidate set to the original report instead of the whole wave.
+
+    Returns:
+        (ticket, similarity) pairs at or above DUPLICATE_THRESHOLD,
+        most similar first
+    """
+    if not signature:
+        return []
+
+    bucket_filter = Q()
+    for band, bucket_hash in band_buckets(signature):
+        bucket_filter |= Q(band=band, bucket_hash=bucket_hash)
+
+    buckets = TicketLSHBucket.objects.filter(bucket_filter)
+    if exclude_id is not None:
+        buckets = buckets.exclude(ticket_id=exclude_id)
+    if originals_only:
+        buckets = buckets.filter(ticket__duplicate_of__isnull=True)
+    # Most shared bands first; on ties, the newest (an outage's copies are recent)
+    candidate_ids = list(
+        buckets
+        .values('ticket_id')
+        .annotate(shared_bands=Count('id'))
+        .order_by('-shared_bands', '-ticket_id')
+        .values_list('ticket_id', flat=True)[:MAX_CANDIDATES]
+    )
+
+    candidates = (
+        Ticket.objects
+        .filter(id__in=candidate_ids, minhash_signature__isnull=False)
+        .only('id', 'minhash_signature', 'created_at', 'duplicate_of')
+    )
+
+    matches = []
+    for candidate in candidates:
+        score = similarity(signature, candidate.minhash_signature)
+        if score >= DUPLICATE_THRESHOLD:
+            matches.append((candidate, score))
+
+    # Prefer the most similar, then the oldest (the original report)
+    matches.sort(key=lambda match: (-match[1], match[0].created_at))
+    return matches[:limit] if limit else matches
+
+
+def find_duplicate_of(signature: Optional[bytes], exclude_id: Optional[int] = None) -> Optional[Ticket]:
+    """
+    Pick the ticket a new ticket should be flagged as a duplicate of.
+
+    Only unflagged tickets are considered, so a wave of duplicates all point
+    at the original report rather than at each other.
+    """
+    matches = find_duplicates(signature, exclude_id=exclude_id, limit=1, originals_only=True)
+    return matches[0][0] if matches else None
+
+
+def index_ticket(ticket: Ticket):
+    """Replace a ticket's LSH bucket rows with those of its current signature."""
+    with transaction.atomic():
+        TicketLSHBucket.objects.filter(ticket=ticket).delete()
+        if ticket.minhash_signature:
+            TicketLSHBucket.objects.bulk_create([
+                TicketLSHBucket(ticket=ticket, band=band, bucket_hash=bucket_hash)
+                for band, bucket_hash in band_buckets(ticket.minhash_signature)
+            ])
@@ -0,0 +1,97 @@
+"""
+Faceted filter counts for the ticket list.
+
+Computes per-value counts for category, priority and status in a single
+GROUPING SETS aggregation. Each facet ignores its own filter so that the
+counts show how many tickets every choice would return.
+"""
+
+from typing import Dict, Optional
+
+from django.db import connection
+
+from ..filters import filter_tickets
+from ..models import Ticket
+
+# Facet name -> choices shown in the FilterBar
+FACET_CHOICES = {
+    'category': Ticket.CATEGORY_CHOICES,
+    'priority': Ticket.PRIORITY_CHOICES,
+    'status': Ticket.STATUS_CHOICES,
+}
+
+
+def _where_sql(queryset):
+    """
+    Compile a queryset's WHERE clause to (sql, params), or ('', []) if it has none.
+
+    Column references are qualified with the ticket table name, so the SQL can
+    be used in a query over that table.
+    """
+    query = queryset.query
+    if not query.where:
+        return '', []
+    compiler = query.get_compiler(connection=connection)
+    sql, params = compiler.compile(query.where)
+    return sql, list(params)
+
+
+def compute_facets(filters: Dict[str, str], search: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Count tickets per category, priority and status under the given filters.
+
+    The filter and search conditions come from filter_tickets(), the same
+    function the list endpoint uses, so the counts always agree with the list.
+    Only the GROUPING SETS aggregation around them is raw SQL.
+
+    Args:
+        filters: Active filters keyed by facet name (e.g. {'status': 'open'})
+        search: Optional search term matched against title and description
+
+    Returns:
+        Dictionary mapping each facet to {value: count}, with every choice
+        represented (even if count is 0)
+    """
+    qn = connection.ops.quote_name
+    table = qn(Ticket._meta.db_table)
+    columns = {name: f"{table}.{qn(Ticket._meta.get_field(name).column)}" for name in FACET_CHOICES}
+
+    # One filtered count per facet, each excluding that facet's own filter
+    count_sql = []
+    count_params = []
+    for facet in FACET_CHOICES:
+        other_filters = {name: value for name, value in filters.items() if name != facet}
+        where, params = _where_sql(filter_tickets(Ticket.objects.all(), other_filters))
+        count_sql.append(f"COUNT(*) FILTER (WHERE {where or 'TRUE'})")
+        count_params.extend(params)
+
+    # Search applies to every facet
+    where_sql, where_params = _where_sql(filter_tickets(Ticket.objects.all(), {}, search=search))
+    if where_sql:
+        where_sql = f"WHERE {where_sql}"
+
+    column_list = ', '.join(columns.values())
+    grouping_list = ', '.join(f"GROUPING({column})" for column in columns.values())
+    grouping_sets = ', '.join(f"({column})" for column in columns.values())
+    sql = (
+        f"SELECT {column_list}, {grouping_list}, {', '.join(count_sql)} "
+        f"FROM {table} {where_sql} "
+        f"GROUP BY GROUPING SETS ({grouping_sets})"
+    )
+
+    facets = {facet: {value: 0 for value, _ in choices} for facet, choices in FACET_CHOICES.items()}
+    facet_count = len(FACET_CHOICES)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, count_params + where_params)
+        for row in cursor.fetchall():
+            values = row[:facet_count]
+            grouping = row[facet_count:2 * facet_count]
+            counts = row[2 * facet_count:]
+            for index, facet in enumerate(FACET_CHOICES):
+                # GROUPING() is 0 for the column this row is grouped by
+                if grouping[index] == 0:
+                    facets[facet][values[index]] = counts[index]
+                    break
+
+    return facets
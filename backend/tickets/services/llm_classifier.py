@@ -3,18 +3,19 @@ LLM Classification Service using Google Gemini API.
 
 This service provides automatic categorization and priority suggestion
 for support tickets based on their description.
+
+The classifier backend is pluggable via settings.LLM_CLASSIFIER_BACKEND (a
+dotted path to a class with a classify(description) method). The Gemini SDK
+is only imported when the backend is first constructed, so management
+commands and worker boot do not pay for its import.
 """
 
 import json
 import logging
+import time
 from typing import Optional, Dict
 from django.conf import settings
-
-try:
-    import google.generativeai as genai
-    GENAI_AVAILABLE = True
-except ImportError:
-    GENAI_AVAILABLE = False
+from django.utils.module_loading import import_string
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +83,10 @@ When in doubt between two priorities, choose the HIGHER priority to ensure urgen
             logger.warning("GEMINI_API_KEY not configured. LLM classification will be disabled.")
             return
         
-        if not GENAI_AVAILABLE:
+        try:
+            # Imported here: the SDK pulls in a large dependency tree
+            import google.generativeai as genai
+        except ImportError:
             logger.error("google-generativeai package not installed. LLM classification will be disabled.")
             return
         
@@ -169,13 +173,47 @@ When in doubt between two priorities, choose the HIGHER priority to ensure urgen
             return None
 
 
+class NullClassifier:
+    """
+    Classifier backend that never suggests anything.
+    
+    Useful for tests and local development without an API key.
+    """
+    
+    def classify(self, description: str) -> Optional[Dict[str, str]]:
+        """Return None (no suggestion) for every description."""
+        return None
+
+
 # Singleton instance
 _classifier_instance = None
 
 
-def get_classifier() -> LLMClassifier:
-    """Get or create the singleton LLM classifier instance."""
+def get_classifier():
+    """Get or create the singleton classifier instance for the configured backend."""
     global _classifier_instance
     if _classifier_instance is None:
-        _classifier_instance = LLMClassifier()
+        backend = import_string(settings.LLM_CLASSIFIER_BACKEND)
+        _classifier_instance = backend()
     return _classifier_instance
+
+
+def warm_up():
+    """
+    Construct the classifier ahead of the first request.
+    
+    Called from gunicorn's post_worker_init hook (gunicorn.conf.py), which
+    runs in each worker after fork, so the SDK import and client setup happen
+    at boot rather than on the first classify call. Failures are logged and
+    left for the request path to handle.
+    """
+    if not settings.LLM_WARMUP:
+        return
+    
+    start = time.perf_counter()
+    try:
+        get_classifier()
+    except Exception as e:
+        logger.error(f"LLM classifier warm-up failed: {e}")
+        return
+    logger.info(f"LLM classifier warmed up in {(time.perf_counter() - start) * 1000:.0f} ms.")
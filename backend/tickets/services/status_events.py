@@ -0,0 +1,219 @@
+"""
+Status transition logging with incremental resolution-time metrics.
+
+Every status change is appended to TicketStatusEvent. When a change completes
+a duration (a ticket is resolved for the first time, or leaves in_progress),
+the duration is folded into per-category and per-priority ResolutionAggregate
+rows, so reading the metrics never has to replay the event log.
+
+Time to resolve is time to first resolution: a ticket that is reopened and
+resolved again contributes one sample, not one per resolution.
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import Ticket, TicketStatusEvent, ResolutionAggregate
+
+
+class QuantileSketch:
+    """
+    Log-bucketed histogram for streaming percentile estimates.
+
+    Each value is stored in the bucket ceil(log_gamma(value)), which keeps the
+    relative error of any quantile below RELATIVE_ACCURACY. The number of
+    buckets grows with log(max / min), so durations from seconds to years fit
+    in a few hundred small integers.
+    """
+
+    RELATIVE_ACCURACY = 0.02
+    GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+
+    def __init__(self, buckets: Optional[Dict[str, int]] = None):
+        """Load a sketch from its JSON form ({bucket_index: count})."""
+        self.buckets = {int(index): count for index, count in (buckets or {}).items()}
+
+    def add(self, value: float, count: int = 1):
+        """Record a value (durations below one second share bucket 0)."""
+        index = math.ceil(math.log(max(value, 1.0)) / math.log(self.GAMMA))
+        self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-th quantile (0 <= q <= 1), or None if empty."""
+        total = sum(self.buckets.values())
+        if total == 0:
+            return None
+
+        rank = q * (total - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return 2 * self.GAMMA ** index / (self.GAMMA + 1)
+        return 2 * self.GAMMA ** max(self.buckets) / (self.GAMMA + 1)
+
+    def to_dict(self) -> Dict[str, int]:
+        """JSON form of the sketch."""
+        return {str(index): count for index, count in self.buckets.items()}
+
+
+def record_status_changes(changes: Iterable[Tuple[Ticket, str]]) -> List[TicketStatusEvent]:
+    """
+    Log status transitions and update the running aggregates.
+
+    Must be called with the tickets' previous status, after their new status
+    has been written, inside the same transaction as that write.
+
+    Args:
+        changes: (ticket, previous_status) pairs; ticket.status is the new status
+
+    Returns:
+        The created events (unchanged statuses are skipped)
+    """
+    now = timezone.now()
+    changes = [(ticket, old) for ticket, old in changes if ticket.status != old]
+    if not changes:
+        return []
+
+    # Tickets leaving in_progress need the time they entered it
+    leaving_in_progress = [
+        ticket.pk for ticket, old in changes if old == Ticket.STATUS_IN_PROGRESS
+    ]
+    entered_in_progress = {}
+    if leaving_in_progress:
+        entered = (
+            TicketStatusEvent.objects
+            .filter(ticket_id__in=leaving_in_progress, to_status=Ticket.STATUS_IN_PROGRESS)
+            .order_by('ticket_id', '-changed_at')
+            .distinct('ticket_id')
+            .values_list('ticket_id', 'changed_at')
+        )
+        entered_in_progress = dict(entered)
+
+    # Only a ticket's first resolution counts towards time to resolve
+    resolving = [ticket.pk for ticket, _ in changes if ticket.status == Ticket.STATUS_RESOLVED]
+    previously_resolved = set()
+    if resolving:
+        previously_resolved = set(
+            TicketStatusEvent.objects
+            .filter(ticket_id__in=resolving, to_status=Ticket.STATUS_RESOLVED)
+            .values_list('ticket_id', flat=True)
+        )
+
+    events = []
+    durations = defaultdict(list)
+    for ticket, old in changes:
+        events.append(TicketStatusEvent(
+            ticket=ticket,
+            from_status=old,
+            to_status=ticket.status,
+            changed_at=now,
+        ))
+
+        if ticket.status == Ticket.STATUS_RESOLVED and ticket.pk not in previously_resolved:
+            seconds = (now - ticket.created_at).total_seconds()
+            _add_duration(durations, ResolutionAggregate.METRIC_RESOLUTION, ticket, seconds)
+
+        if old == Ticket.STATUS_IN_PROGRESS and ticket.pk in entered_in_progress:
+            seconds = (now - entered_in_progress[ticket.pk]).total_seconds()
+            _add_duration(durations, ResolutionAggregate.METRIC_IN_PROGRESS, ticket, seconds)
+
+    with transaction.atomic():
+        created = TicketStatusEvent.objects.bulk_create(events)
+        # Lock aggregate rows in a fixed order to avoid deadlocks between writers
+        for key in sorted(durations):
+            _update_aggregate(key, durations[key])
+
+    return created
+
+
+def bulk_set_status(queryset, new_status: str) -> int:
+    """
+    Set the status of every ticket in a queryset, logging each transition.
+
+    Use this instead of queryset.update(status=...) so bulk changes are
+    recorded in the event log and the resolution metrics.
+
+    Returns:
+        Number of tickets whose status changed
+    """
+    with transaction.atomic():
+        tickets = list(
+            queryset.exclude(status=new_status)
+            .select_for_update()
+            .only('id', 'status', 'category', 'priority', 'created_at')
+        )
+        if not tickets:
+            return 0
+
+        changes = []
+        for ticket in tickets:
+            changes.append((ticket, ticket.status))
+            ticket.status = new_status
+        Ticket.objects.filter(pk__in=[ticket.pk for ticket in tickets]).update(status=new_status)
+        record_status_changes(changes)
+
+    return len(tickets)
+
+
+def get_resolution_stats() -> Dict[str, Dict[str, Dict[str, Dict]]]:
+    """
+    Summarize every aggregate row: count, mean and percentiles per value.
+
+    Reads a fixed number of rows (metrics x dimensions x choices), so the
+    cost does not depend on how much history has been recorded.
+    """
+    stats = {}
+    for metric, _ in ResolutionAggregate.METRIC_CHOICES:
+        stats[metric] = {
+            'by_category': {choice: _summarize(None) for choice, _ in Ticket.CATEGORY_CHOICES},
+            'by_priority': {choice: _summarize(None) for choice, _ in Ticket.PRIORITY_CHOICES},
+        }
+
+    for aggregate in ResolutionAggregate.objects.all():
+        stats[aggregate.metric][f"by_{aggregate.dimension}"][aggregate.value] = _summarize(aggregate)
+
+    return stats
+
+
+def _add_duration(durations, metric: str, ticket: Ticket, seconds: float):
+    """Queue a duration for the ticket's category and priority aggregates."""
+    durations[(metric, ResolutionAggregate.DIMENSION_CATEGORY, ticket.category)].append(seconds)
+    durations[(metric, ResolutionAggregate.DIMENSION_PRIORITY, ticket.priority)].append(seconds)
+
+
+def _update_aggregate(key: Tuple[str, str, str], seconds: List[float]):
+    """Fold durations into one aggregate row under a row lock."""
+    metric, dimension, value = key
+    aggregate, _ = (
+        ResolutionAggregate.objects
+        .select_for_update()
+        .get_or_create(metric=metric, dimension=dimension, value=value)
+    )
+    sketch = QuantileSketch(aggregate.sketch)
+    for duration in seconds:
+        sketch.add(duration)
+
+    aggregate.count += len(seconds)
+    aggregate.total_seconds += sum(seconds)
+    aggregate.sketch = sketch.to_dict()
+    aggregate.save(update_fields=['count', 'total_seconds', 'sketch'])
+
+
+def _summarize(aggregate: Optional[ResolutionAggregate]) -> Dict:
+    """Turn an aggregate row into count, mean and percentile estimates (seconds)."""
+    if aggregate is None or aggregate.count == 0:
+        return {'count': 0, 'mean_seconds': None, 'p50_seconds': None, 'p90_seconds': None, 'p99_seconds': None}
+
+    sketch = QuantileSketch(aggregate.sketch)
+    return {
+        'count': aggregate.count,
+        'mean_seconds': round(aggregate.total_seconds / aggregate.count, 1),
+        'p50_seconds': round(sketch.quantile(0.5), 1),
+        'p90_seconds': round(sketch.quantile(0.9), 1),
+        'p99_seconds': round(sketch.quantile(0.99), 1),
+    }
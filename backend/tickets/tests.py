@@ -1,3 +1,1116 @@
-from django.test import TestCase
+import gzip
+import os
+import runpy
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from . import middleware
+from .checks import check_classify_thread_budget
+from .middleware import CompressionMiddleware, choose_encoding
+from .models import ResolutionAggregate, Ticket, TicketLSHBucket, TicketStatusEvent
+from .pagination import TicketPagination
+from .parsers import MessagePackParser, ORJSONParser
+from .renderers import MessagePackRenderer, ORJSONRenderer
+from .services.counting import count_queryset
+from .services.facets import compute_facets
+from .services.admission import AdmissionController, AdmissionRejected
+from .services import duplicates, llm_classifier, vector_index
+from .services.duplicates import DUPLICATE_THRESHOLD, band_buckets, compute_signature, similarity
+from .services.vector_index import VectorIndex, embed, index_path
+from .services.status_events import QuantileSketch, bulk_set_status, record_status_changes
+from .throttling import CacheTokenBucketStore, LocalTokenBucketStore, refill
+
+
+class ClaimNextTicketTests(TransactionTestCase):
+    """
+    Tests for POST /api/tickets/claim-next/.
+
+    TransactionTestCase is used so that each thread sees committed rows and
+    row locks behave as they do in production.
+    """
+
+    url = '/api/tickets/claim-next/'
+
+    def create_ticket(self, priority, age_hours=0):
+        ticket = Ticket.objects.create(
+            title=f"{priority} ticket",
+            description="Something is broken",
+            category=Ticket.CATEGORY_TECHNICAL,
+            priority=priority,
+        )
+        if age_hours:
+            # created_at is auto_now_add, so backdate it and resave the score
+            ticket.created_at = timezone.now() - timedelta(hours=age_hours)
+            ticket.save()
+        return ticket
+
+    def test_claims_most_urgent_ticket(self):
+        self.create_ticket(Ticket.PRIORITY_LOW)
+        critical = self.create_ticket(Ticket.PRIORITY_CRITICAL)
+        self.create_ticket(Ticket.PRIORITY_MEDIUM)
+
+        response = APIClient().post(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['id'], critical.id)
+        self.assertEqual(response.data['status'], Ticket.STATUS_IN_PROGRESS)
+
+    def test_age_outranks_priority_after_enough_waiting(self):
+        self.create_ticket(Ticket.PRIORITY_HIGH)
+        old_medium = self.create_ticket(
+            Ticket.PRIORITY_MEDIUM,
+            age_hours=Ticket.URGENCY_HOURS_PER_PRIORITY + 1,
+        )
+
+        response = APIClient().post(self.url)
+
+        self.assertEqual(response.data['id'], old_medium.id)
+
+    def test_bulk_created_ticket_does_not_jump_queue(self):
+        Ticket.objects.bulk_create([
+            Ticket(title="low ticket", description="Something is broken",
+                   category=Ticket.CATEGORY_TECHNICAL, priority=Ticket.PRIORITY_LOW),
+        ])
+        critical = self.create_ticket(Ticket.PRIORITY_CRITICAL)
+
+        response = APIClient().post(self.url)
+
+        self.assertEqual(response.data['id'], critical.id)
+
+    def test_unscored_ticket_is_claimed_last(self):
+        # e.g. loaded with loaddata or inserted with raw SQL
+        unscored = self.create_ticket(Ticket.PRIORITY_CRITICAL)
+        Ticket.objects.filter(pk=unscored.pk).update(urgency_score=None)
+        low = self.create_ticket(Ticket.PRIORITY_LOW)
+
+        first = APIClient().post(self.url)
+        second = APIClient().post(self.url)
+
+        self.assertEqual([first.data['id'], second.data['id']], [low.id, unscored.id])
+
+    def test_queryset_update_refreshes_score(self):
+        ticket = self.create_ticket(Ticket.PRIORITY_LOW)
+        critical = self.create_ticket(Ticket.PRIORITY_CRITICAL)
+
+        Ticket.objects.filter(pk=ticket.pk).update(priority=Ticket.PRIORITY_CRITICAL)
+        ticket.refresh_from_db()
+
+        self.assertAlmostEqual(
+            ticket.urgency_score,
+            Ticket.urgency_for(Ticket.PRIORITY_CRITICAL, ticket.created_at),
+            places=6,
+        )
+        # Same priority, so the older ticket comes first
+        self.assertEqual(APIClient().post(self.url).data['id'], ticket.id)
+        self.assertEqual(APIClient().post(self.url).data['id'], critical.id)
+
+    def test_empty_queue_returns_no_content(self):
+        response = APIClient().post(self.url)
+
+        self.assertEqual(response.status_code, 204)
+
+    def test_concurrent_claims_never_duplicate(self):
+        ticket_count = 40
+        worker_count = 16
+        for index in range(ticket_count):
+            priority = Ticket.PRIORITY_CHOICES[index % len(Ticket.PRIORITY_CHOICES)][0]
+            self.create_ticket(priority)
+
+        claimed = []
+        errors = []
+        lock = threading.Lock()
+        start = threading.Barrier(worker_count)
+
+        def worker():
+            client = APIClient()
+            try:
+                start.wait()
+                while True:
+                    response = client.post(self.url)
+                    if response.status_code == 204:
+                        break
+                    with lock:
+                        claimed.append(response.data['id'])
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(worker_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(claimed), ticket_count)
+        self.assertEqual(len(set(claimed)), ticket_count)
+        self.assertFalse(Ticket.objects.filter(status=Ticket.STATUS_OPEN).exists())
+
+
+class StatusEventTests(TestCase):
+    """Tests for the status event log and incremental resolution metrics."""
+
+    def create_ticket(self, age_hours=2, **fields):
+        ticket = Ticket.objects.create(
+            title="Checkout broken",
+            description="Payment page returns an error",
+            category=fields.get('category', Ticket.CATEGORY_BILLING),
+            priority=fields.get('priority', Ticket.PRIORITY_HIGH),
+        )
+        Ticket.objects.filter(pk=ticket.pk).update(created_at=timezone.now() - timedelta(hours=age_hours))
+        ticket.refresh_from_db()
+        return ticket
+
+    def aggregate(self, metric, dimension, value):
+        return ResolutionAggregate.objects.get(metric=metric, dimension=dimension, value=value)
+
+    def test_resolution_duration_recorded_per_category_and_priority(self):
+        ticket = self.create_ticket(age_hours=2)
+        ticket.status = Ticket.STATUS_RESOLVED
+        ticket.save()
+
+        events = record_status_changes([(ticket, Ticket.STATUS_OPEN)])
+
+        self.assertEqual(len(events), 1)
+        for dimension, value in [('category', 'billing'), ('priority', 'high')]:
+            aggregate = self.aggregate(ResolutionAggregate.METRIC_RESOLUTION, dimension, value)
+            self.assertEqual(aggregate.count, 1)
+            self.assertAlmostEqual(aggregate.total_seconds, 7200, delta=60)
+
+    def test_in_progress_duration_measured_from_entering_event(self):
+        ticket = self.create_ticket()
+        bulk_set_status(Ticket.objects.filter(pk=ticket.pk), Ticket.STATUS_IN_PROGRESS)
+        TicketStatusEvent.objects.filter(ticket=ticket).update(changed_at=timezone.now() - timedelta(minutes=30))
+
+        bulk_set_status(Ticket.objects.filter(pk=ticket.pk), Ticket.STATUS_RESOLVED)
+
+        aggregate = self.aggregate(ResolutionAggregate.METRIC_IN_PROGRESS, 'category', 'billing')
+        self.assertEqual(aggregate.count, 1)
+        self.assertAlmostEqual(aggregate.total_seconds, 1800, delta=60)
+
+    def test_reopened_ticket_counts_first_resolution_only(self):
+        ticket = self.create_ticket(age_hours=2)
+        tickets = Ticket.objects.filter(pk=ticket.pk)
+        bulk_set_status(tickets, Ticket.STATUS_RESOLVED)
+        bulk_set_status(tickets, Ticket.STATUS_OPEN)
+
+        bulk_set_status(tickets, Ticket.STATUS_RESOLVED)
+
+        aggregate = self.aggregate(ResolutionAggregate.METRIC_RESOLUTION, 'category', 'billing')
+        self.assertEqual(aggregate.count, 1)
+        self.assertAlmostEqual(aggregate.total_seconds, 7200, delta=60)
+        self.assertEqual(TicketStatusEvent.objects.filter(to_status=Ticket.STATUS_RESOLVED).count(), 2)
+
+    def test_unchanged_status_is_not_logged(self):
+        ticket = self.create_ticket()
+
+        self.assertEqual(record_status_changes([(ticket, ticket.status)]), [])
+        self.assertFalse(TicketStatusEvent.objects.exists())
+
+    def test_bulk_set_status_logs_each_changed_ticket(self):
+        tickets = [self.create_ticket() for _ in range(3)]
+        Ticket.objects.filter(pk=tickets[0].pk).update(status=Ticket.STATUS_RESOLVED)
+
+        changed = bulk_set_status(Ticket.objects.all(), Ticket.STATUS_RESOLVED)
+
+        self.assertEqual(changed, 2)
+        self.assertEqual(TicketStatusEvent.objects.filter(to_status=Ticket.STATUS_RESOLVED).count(), 2)
+        self.assertFalse(Ticket.objects.exclude(status=Ticket.STATUS_RESOLVED).exists())
+
+    def test_patch_and_put_log_status_once(self):
+        ticket = self.create_ticket()
+        client = APIClient()
+        url = f'/api/tickets/{ticket.pk}/'
+
+        client.patch(url, {'status': 'in_progress'}, format='json')
+        client.patch(url, {'status': 'in_progress'}, format='json')
+        client.put(url, {
+            'title': ticket.title,
+            'description': ticket.description,
+            'category': ticket.category,
+            'priority': ticket.priority,
+            'status': 'resolved',
+        }, format='json')
+
+        transitions = list(
+            TicketStatusEvent.objects.order_by('changed_at', 'id').values_list('from_status', 'to_status')
+        )
+        self.assertEqual(transitions, [('open', 'in_progress'), ('in_progress', 'resolved')])
+
+    def test_resolution_stats_endpoint(self):
+        ticket = self.create_ticket()
+        APIClient().patch(f'/api/tickets/{ticket.pk}/', {'status': 'resolved'}, format='json')
+
+        response = APIClient().get('/api/tickets/stats/resolution/')
+
+        self.assertEqual(response.status_code, 200)
+        billing = response.data['resolution']['by_category']['billing']
+        self.assertEqual(billing['count'], 1)
+        self.assertAlmostEqual(billing['mean_seconds'], 7200, delta=60)
+        self.assertIsNotNone(billing['p90_seconds'])
+        self.assertEqual(response.data['resolution']['by_category']['general']['count'], 0)
+        self.assertEqual(response.data['in_progress']['by_priority']['high']['count'], 0)
+
+
+class StatusEventConcurrencyTests(TransactionTestCase):
+    """Concurrent status updates must each be logged exactly once."""
+
+    def test_concurrent_patches_record_one_transition(self):
+        ticket = Ticket.objects.create(
+            title="Outage",
+            description="Everything is down",
+            category=Ticket.CATEGORY_TECHNICAL,
+            priority=Ticket.PRIORITY_CRITICAL,
+        )
+        worker_count = 8
+        start = threading.Barrier(worker_count)
+        errors = []
+
+        def worker():
+            try:
+                start.wait()
+                APIClient().patch(f'/api/tickets/{ticket.pk}/', {'status': 'resolved'}, format='json')
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(worker_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(TicketStatusEvent.objects.filter(ticket=ticket).count(), 1)
+        aggregate = ResolutionAggregate.objects.get(metric='resolution', dimension='category', value='technical')
+        self.assertEqual(aggregate.count, 1)
+
+
+class QuantileSketchTests(SimpleTestCase):
+    """Tests for the streaming percentile sketch behind resolution metrics."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        sketch = QuantileSketch()
+        for value in range(1, 10001):
+            sketch.add(value)
+
+        for q, expected in [(0.5, 5000), (0.9, 9000), (0.99, 9900)]:
+            estimate = sketch.quantile(q)
+            self.assertLessEqual(abs(estimate - expected) / expected, QuantileSketch.RELATIVE_ACCURACY)
+
+    def test_round_trips_through_json_form(self):
+        sketch = QuantileSketch()
+        for value in (30, 600, 86400):
+            sketch.add(value)
+
+        restored = QuantileSketch(sketch.to_dict())
+
+        self.assertEqual(restored.quantile(0.5), sketch.quantile(0.5))
+
+    def test_empty_sketch_has_no_quantiles(self):
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+
+class TokenBucketTests(SimpleTestCase):
+    """Tests for the in-memory token bucket used by the classify rate limit."""
+
+    def test_allows_burst_then_rejects_with_retry_after(self):
+        store = LocalTokenBucketStore(rate=2, burst=3)
+
+        results = [store.consume('client') for _ in range(4)]
+
+        self.assertEqual([allowed for allowed, _ in results], [True, True, True, False])
+        self.assertAlmostEqual(results[-1][1], 0.5, places=2)
+
+    def test_clients_have_separate_buckets(self):
+        store = LocalTokenBucketStore(rate=1, burst=1)
+
+        self.assertTrue(store.consume('a')[0])
+        self.assertTrue(store.consume('b')[0])
+        self.assertFalse(store.consume('a')[0])
+
+    def test_refill_is_capped_at_burst(self):
+        self.assertEqual(refill(0, updated_at=0, now=100, rate=1, burst=5), 5)
+        self.assertEqual(refill(1, updated_at=0, now=2, rate=1, burst=5), 3)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CacheTokenBucketTests(SimpleTestCase):
+    """Tests for the cache-backed token bucket shared across workers."""
+
+    def test_state_is_shared_between_store_instances(self):
+        first = CacheTokenBucketStore(rate=1, burst=2)
+        second = CacheTokenBucketStore(rate=1, burst=2)
+
+        self.assertTrue(first.consume('shared')[0])
+        self.assertTrue(second.consume('shared')[0])
+        allowed, retry_after = first.consume('shared')
+
+        self.assertFalse(allowed)
+        self.assertGreater(retry_after, 0)
+
+    def test_contended_lock_rejects(self):
+        store = CacheTokenBucketStore(rate=1, burst=5)
+        store.cache.add('ratelimit:busy:lock', 1)
+
+        self.assertFalse(store.consume('busy')[0])
+
+
+class AdmissionControllerTests(SimpleTestCase):
+    """Tests for the bounded, priority-ordered classify admission queue."""
+
+    def test_sheds_when_lane_queue_is_full(self):
+        controller = AdmissionController(max_concurrent=1, max_queued={'interactive': 1, 'batch': 0}, timeout=1)
+
+        with controller.admit('interactive'):
+            with self.assertRaises(AdmissionRejected):
+                with controller.admit('batch'):
+                    pass
+
+        self.assertEqual(controller.snapshot(), {'running': 0, 'queued': {'interactive': 0, 'batch': 0}})
+
+    def test_times_out_waiting_for_slot(self):
+        controller = AdmissionController(max_concurrent=1, max_queued={'interactive': 1, 'batch': 1}, timeout=0.05)
+        holding = threading.Event()
+        release = threading.Event()
+
+        def hold_slot():
+            with controller.admit('batch'):
+                holding.set()
+                release.wait(1)
+
+        holder = threading.Thread(target=hold_slot)
+        holder.start()
+        holding.wait(1)
+        try:
+            with self.assertRaises(AdmissionRejected):
+                with controller.admit('interactive'):
+                    pass
+        finally:
+            release.set()
+            holder.join()
+
+    def test_interactive_admitted_before_earlier_batch(self):
+        controller = AdmissionController(max_concurrent=1, max_queued={'interactive': 4, 'batch': 4}, timeout=2)
+        order = []
+        holding = threading.Event()
+        release = threading.Event()
+
+        def hold_slot():
+            with controller.admit('batch'):
+                holding.set()
+                release.wait(2)
+
+        def call(lane):
+            with controller.admit(lane):
+                order.append(lane)
+
+        holder = threading.Thread(target=hold_slot)
+        holder.start()
+        holding.wait(1)
+
+        batch = threading.Thread(target=call, args=('batch',))
+        batch.start()
+        while controller.snapshot()['queued']['batch'] == 0:
+            time.sleep(0.001)
+        interactive = threading.Thread(target=call, args=('interactive',))
+        interactive.start()
+        while controller.snapshot()['queued']['interactive'] == 0:
+            time.sleep(0.001)
+
+        release.set()
+        for thread in (holder, batch, interactive):
+            thread.join()
+
+        self.assertEqual(order, ['interactive', 'batch'])
+
+
+@override_settings(LLM_CLASSIFIER_BACKEND='tickets.services.llm_classifier.NullClassifier')
+class ClassifyLoadProtectionTests(SimpleTestCase):
+    """Tests for rate limiting and load shedding on POST /api/tickets/classify/."""
+
+    url = '/api/tickets/classify/'
+    body = {'description': 'VPN keeps disconnecting'}
+
+    def setUp(self):
+        patcher = mock.patch('tickets.services.llm_classifier._classifier_instance', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rate_limited_client_gets_429_with_retry_after(self):
+        store = LocalTokenBucketStore(rate=0.5, burst=2)
+        client = APIClient()
+
+        with mock.patch('tickets.throttling._store_instance', store):
+            responses = [client.post(self.url, self.body, format='json') for _ in range(3)]
+
+        self.assertEqual([response.status_code for response in responses], [200, 200, 429])
+        self.assertEqual(responses[-1]['Retry-After'], '2')
+
+    def test_saturated_worker_sheds_with_503(self):
+        store = LocalTokenBucketStore(rate=100, burst=100)
+        controller = AdmissionController(max_concurrent=0, max_queued={'interactive': 0, 'batch': 0}, timeout=3)
+
+        with mock.patch('tickets.throttling._store_instance', store), \
+                mock.patch('tickets.services.admission._controller_instance', controller):
+            response = APIClient().post(self.url, self.body, format='json')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '3')
+
+
+class TicketPaginationTests(SimpleTestCase):
+    """Tests for paging with inexact total counts."""
+
+    def paginate(self, query, estimate):
+        paginator = TicketPagination()
+        request = Request(APIRequestFactory().get(f'/api/tickets/{query}'))
+        # A list stands in for the queryset; the count strategy is mocked
+        with mock.patch('tickets.pagination.count_queryset', return_value=estimate):
+            page = paginator.paginate_queryset(list(range(25)), request)
+        return page, paginator
+
+    def test_unpaginated_without_limit(self):
+        page, _ = self.paginate('', (25, True))
+
+        self.assertIsNone(page)
+
+    def test_next_page_follows_rows_not_underestimated_count(self):
+        page, paginator = self.paginate('?limit=10&offset=10&count=estimate', (12, False))
+
+        self.assertEqual(page, list(range(10, 20)))
+        self.assertIsNotNone(paginator.get_next_link())
+        self.assertEqual(paginator.count, 21)
+        self.assertFalse(paginator.count_is_exact)
+
+    def test_offset_past_end_keeps_exact_count(self):
+        page, paginator = self.paginate('?limit=10&offset=100&count=exact', (25, True))
+
+        self.assertEqual(page, [])
+        self.assertIsNone(paginator.get_next_link())
+        self.assertEqual(paginator.count, 25)
+        self.assertTrue(paginator.count_is_exact)
+
+    def test_offset_past_end_leaves_estimate_inexact(self):
+        page, paginator = self.paginate('?limit=10&offset=100&count=estimate', (30, False))
+
+        self.assertEqual(page, [])
+        self.assertEqual(paginator.count, 30)
+        self.assertFalse(paginator.count_is_exact)
+
+    def test_last_page_makes_count_exact(self):
+        page, paginator = self.paginate('?limit=10&offset=20&count=capped', (10000, False))
+
+        self.assertEqual(page, list(range(20, 25)))
+        self.assertIsNone(paginator.get_next_link())
+        self.assertEqual(paginator.count, 25)
+        self.assertTrue(paginator.count_is_exact)
+
+
+@override_settings(TICKET_COUNT_CAP=5, TICKET_COUNT_EXACT_THRESHOLD=1000)
+class CountStrategyTests(TestCase):
+    """Tests for the ticket list count strategies."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Ticket.objects.bulk_create([
+            Ticket(
+                title=f"Ticket {index}",
+                description="VPN is down" if index % 2 else "Invoice question",
+                category=Ticket.CATEGORY_TECHNICAL,
+                priority=Ticket.PRIORITY_LOW,
+            )
+            for index in range(8)
+        ])
+
+    def test_exact(self):
+        self.assertEqual(count_queryset(Ticket.objects.all(), 'exact'), (8, True))
+
+    def test_capped_reports_cap_as_inexact(self):
+        self.assertEqual(count_queryset(Ticket.objects.all(), 'capped'), (5, False))
+        self.assertEqual(count_queryset(Ticket.objects.filter(description__icontains='vpn'), 'capped'), (4, True))
+
+    def test_estimate_uses_planner_rows(self):
+        count, is_exact = count_queryset(Ticket.objects.filter(description__icontains='vpn'), 'estimate')
+
+        self.assertIsInstance(count, int)
+        self.assertFalse(is_exact)
+
+    def test_auto_is_exact_for_small_estimates(self):
+        self.assertEqual(count_queryset(Ticket.objects.filter(description__icontains='vpn'), 'auto'), (4, True))
+
+
+OUTAGE_REPORT = "Our VPN is down and nobody in the London office can connect to the internal network since 9am"
+OUTAGE_REPORT_COPY = "Our VPN is down and nobody in the Paris office can connect to the internal network since 9am"
+BILLING_REPORT = "I was charged twice for the annual plan, please refund the second invoice"
+
+
+class MinHashSignatureTests(SimpleTestCase):
+    """Tests for the MinHash signature and similarity maths."""
+
+    def test_identical_text_has_identical_signature(self):
+        self.assertEqual(compute_signature(OUTAGE_REPORT), compute_signature(OUTAGE_REPORT.upper()))
+        self.assertEqual(similarity(compute_signature(OUTAGE_REPORT), compute_signature(OUTAGE_REPORT)), 1.0)
+
+    def test_near_duplicates_score_above_threshold(self):
+        score = similarity(compute_signature(OUTAGE_REPORT), compute_signature(OUTAGE_REPORT_COPY))
+
+        self.assertGreaterEqual(score, DUPLICATE_THRESHOLD)
+
+    def test_unrelated_texts_score_near_zero(self):
+        score = similarity(compute_signature(OUTAGE_REPORT), compute_signature(BILLING_REPORT))
+
+        self.assertLess(score, 0.1)
+
+    def test_signature_layout(self):
+        signature = compute_signature(OUTAGE_REPORT)
+
+        self.assertEqual(len(signature), duplicates.NUM_PERMUTATIONS * 4)
+        self.assertEqual([band for band, _ in band_buckets(signature)], list(range(duplicates.BANDS)))
+        self.assertIsNone(compute_signature("  ...  "))
+
+    def test_long_description_is_hashed_in_blocks(self):
+        words = [f"word{index}" for index in range(duplicates._SHINGLE_BLOCK * 2 + 10)]
+        text = ' '.join(words)
+
+        # Same result as hashing every shingle in a single block
+        with mock.patch.object(duplicates, '_SHINGLE_BLOCK', len(words)):
+            single_block = compute_signature(text)
+        self.assertEqual(compute_signature(text), single_block)
+
+
+class DuplicateDetectionTests(TestCase):
+    """Tests for flagging and listing near-duplicate tickets."""
+
+    def create_ticket(self, description, title="VPN outage"):
+        response = APIClient().post('/api/tickets/', {
+            'title': title,
+            'description': description,
+            'category': Ticket.CATEGORY_TECHNICAL,
+            'priority': Ticket.PRIORITY_HIGH,
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        return response.data
+
+    def test_create_flags_near_duplicate(self):
+        original = self.create_ticket(OUTAGE_REPORT)
+        copy = self.create_ticket(OUTAGE_REPORT_COPY)
+        unrelated = self.create_ticket(BILLING_REPORT, title="Double charge")
+
+        self.assertIsNone(original['duplicate_of'])
+        self.assertEqual(copy['duplicate_of'], original['id'])
+        self.assertIsNone(unrelated['duplicate_of'])
+
+    def test_outage_wave_points_at_original(self):
+        original = self.create_ticket(OUTAGE_REPORT)
+        copies = [self.create_ticket(OUTAGE_REPORT_COPY) for _ in range(3)]
+
+        self.assertEqual({copy['duplicate_of'] for copy in copies}, {original['id']})
+
+    def test_candidates_are_capped(self):
+        for _ in range(4):
+            self.create_ticket(OUTAGE_REPORT)
+
+        with mock.patch.object(duplicates, 'MAX_CANDIDATES', 2):
+            matches = duplicates.find_duplicates(compute_signature(OUTAGE_REPORT))
+
+        self.assertEqual(len(matches), 2)
+
+    def test_real_match_survives_chance_collisions(self):
+        # Older, unrelated tickets that each share one bucket with the new report,
+        # as low-similarity pairs occasionally do on a large table
+        band, bucket_hash = band_buckets(compute_signature(OUTAGE_REPORT_COPY))[0]
+        decoys = Ticket.objects.bulk_create([
+            Ticket(title=f"Unrelated {index}", description=f"{BILLING_REPORT} {index}",
+                   category=Ticket.CATEGORY_BILLING, priority=Ticket.PRIORITY_LOW,
+                   minhash_signature=compute_signature(f"{BILLING_REPORT} {index}"))
+            for index in range(10)
+        ])
+        TicketLSHBucket.objects.bulk_create([
+            TicketLSHBucket(ticket=decoy, band=band, bucket_hash=bucket_hash) for decoy in decoys
+        ])
+        original = self.create_ticket(OUTAGE_REPORT)
+
+        with mock.patch.object(duplicates, 'MAX_CANDIDATES', 3):
+            copy = self.create_ticket(OUTAGE_REPORT_COPY)
+
+        self.assertEqual(copy['duplicate_of'], original['id'])
+
+    def test_duplicates_endpoint(self):
+        original = self.create_ticket(OUTAGE_REPORT)
+        copy = self.create_ticket(OUTAGE_REPORT_COPY)
+        self.create_ticket(BILLING_REPORT, title="Double charge")
+
+        response = APIClient().get(f"/api/tickets/{original['id']}/duplicates/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['id'] for row in response.data], [copy['id']])
+        self.assertEqual(response.data[0]['title'], "VPN outage")
+        self.assertGreaterEqual(response.data[0]['similarity'], DUPLICATE_THRESHOLD)
+
+    def test_put_refreshes_signature(self):
+        ticket = self.create_ticket(BILLING_REPORT, title="Double charge")
+
+        response = APIClient().put(f"/api/tickets/{ticket['id']}/", {
+            'title': "VPN outage",
+            'description': OUTAGE_REPORT,
+            'category': Ticket.CATEGORY_TECHNICAL,
+            'priority': Ticket.PRIORITY_HIGH,
+            'status': Ticket.STATUS_OPEN,
+        }, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(bytes(Ticket.objects.get(pk=ticket['id']).minhash_signature), compute_signature(OUTAGE_REPORT))
+        self.assertEqual(
+            [match.pk for match, _ in duplicates.find_duplicates(compute_signature(OUTAGE_REPORT_COPY))],
+            [ticket['id']],
+        )
+
+    def test_backfill_minhash(self):
+        tickets = Ticket.objects.bulk_create([
+            Ticket(title="VPN outage", description=description,
+                   category=Ticket.CATEGORY_TECHNICAL, priority=Ticket.PRIORITY_HIGH)
+            for description in [OUTAGE_REPORT, OUTAGE_REPORT_COPY, BILLING_REPORT]
+        ])
+
+        call_command('backfill_minhash', '--link-duplicates', '--batch-size', '2', stdout=StringIO())
+
+        original, copy, unrelated = (Ticket.objects.get(pk=ticket.pk) for ticket in tickets)
+        self.assertEqual(bytes(original.minhash_signature), compute_signature(OUTAGE_REPORT))
+        self.assertEqual(TicketLSHBucket.objects.count(), 3 * duplicates.BANDS)
+        self.assertIsNone(original.duplicate_of_id)
+        self.assertEqual(copy.duplicate_of_id, original.pk)
+        self.assertIsNone(unrelated.duplicate_of_id)
+
+
+class VectorIndexTests(SimpleTestCase):
+    """Tests for ticket embeddings and the memory-mapped vector index."""
+
+    dimensions = 64
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / 'vectors.f32'
+
+    def test_embedding_is_normalized_and_deterministic(self):
+        vector = embed("VPN outage", OUTAGE_REPORT, self.dimensions)
+
+        self.assertEqual(vector.shape, (self.dimensions,))
+        self.assertAlmostEqual(float((vector ** 2).sum()), 1.0, places=5)
+        self.assertTrue((vector == embed("VPN outage", OUTAGE_REPORT, self.dimensions)).all())
+        self.assertFalse(embed("", "...", self.dimensions).any())
+
+    def test_upsert_grows_file_in_chunks(self):
+        index = VectorIndex(self.path, self.dimensions)
+
+        with mock.patch.object(vector_index, 'GROWTH_ROWS', 4):
+            index.upsert(1, embed("a", OUTAGE_REPORT, self.dimensions))
+            self.assertEqual(index.capacity, 4)
+            index.upsert(5, embed("b", BILLING_REPORT, self.dimensions))
+            self.assertEqual(index.capacity, 8)
+
+        self.assertIsNotNone(index.vector(1))
+        self.assertIsNone(index.vector(2))
+        self.assertIsNone(index.vector(100))
+
+    def test_remove_clears_row(self):
+        index = VectorIndex(self.path, self.dimensions)
+        index.upsert(3, embed("a", OUTAGE_REPORT, self.dimensions))
+
+        index.remove(3)
+        index.remove(10 ** 6)
+
+        self.assertIsNone(index.vector(3))
+
+    def test_most_similar_ranks_and_excludes(self):
+        index = VectorIndex(self.path, self.dimensions)
+        for ticket_id, description in [(1, OUTAGE_REPORT), (2, OUTAGE_REPORT_COPY), (3, BILLING_REPORT)]:
+            index.upsert(ticket_id, embed("", description, self.dimensions))
+
+        matches = index.most_similar(index.vector(1), k=2, exclude_id=1)
+
+        self.assertEqual([ticket_id for ticket_id, _ in matches][0], 2)
+        self.assertNotIn(1, [ticket_id for ticket_id, _ in matches])
+        self.assertGreater(matches[0][1], 0.5)
+
+    def test_remaps_when_another_process_grows_the_file(self):
+        writer = VectorIndex(self.path, self.dimensions)
+        reader = VectorIndex(self.path, self.dimensions)
+        writer.upsert(1, embed("a", OUTAGE_REPORT, self.dimensions))
+        reader.matrix()
+
+        with mock.patch.object(vector_index, 'GROWTH_ROWS', 4):
+            writer.upsert(9, embed("b", BILLING_REPORT, self.dimensions))
+
+        self.assertIsNotNone(reader.vector(9))
+
+    def test_file_name_carries_dimensions(self):
+        self.assertEqual(index_path(self.path, 256).name, 'vectors.256d.f32')
+
+
+class SimilarTicketTests(TestCase):
+    """Tests for GET /api/tickets/{id}/similar/ and keeping the index current."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(TICKET_VECTOR_INDEX_PATH=Path(directory.name) / 'vectors.f32')
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        instance_patch = mock.patch.object(vector_index, '_index_instance', None)
+        instance_patch.start()
+        self.addCleanup(instance_patch.stop)
+
+    def create_ticket(self, description, title="VPN outage"):
+        # The index is updated on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            response = APIClient().post('/api/tickets/', {
+                'title': title,
+                'description': description,
+                'category': Ticket.CATEGORY_TECHNICAL,
+                'priority': Ticket.PRIORITY_HIGH,
+            }, format='json')
+        self.assertEqual(response.status_code, 201)
+        return response.data['id']
+
+    def similar_ids(self, ticket_id, k=10):
+        response = APIClient().get(f"/api/tickets/{ticket_id}/similar/", {'k': k})
+        self.assertEqual(response.status_code, 200)
+        return [row['id'] for row in response.data]
+
+    def test_similar_endpoint(self):
+        outage = self.create_ticket(OUTAGE_REPORT)
+        copy = self.create_ticket(OUTAGE_REPORT_COPY)
+        self.create_ticket(BILLING_REPORT, title="Double charge")
+
+        self.assertEqual(self.similar_ids(outage, k=1), [copy])
+        self.assertNotIn(outage, self.similar_ids(outage))
+
+    def test_put_refreshes_vector(self):
+        outage = self.create_ticket(OUTAGE_REPORT)
+        ticket = self.create_ticket(BILLING_REPORT, title="Double charge")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = APIClient().put(f"/api/tickets/{ticket}/", {
+                'title': "VPN outage",
+                'description': OUTAGE_REPORT_COPY,
+                'category': Ticket.CATEGORY_TECHNICAL,
+                'priority': Ticket.PRIORITY_HIGH,
+                'status': Ticket.STATUS_OPEN,
+            }, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.similar_ids(outage, k=1), [ticket])
+
+    def test_delete_removes_vector(self):
+        outage = self.create_ticket(OUTAGE_REPORT)
+        copy = self.create_ticket(OUTAGE_REPORT_COPY)
+
+        APIClient().delete(f"/api/tickets/{copy}/")
+
+        self.assertIsNone(vector_index.get_vector_index().vector(copy))
+        self.assertEqual(self.similar_ids(outage), [])
+
+    def test_rebuild_replays_changes_made_during_rebuild(self):
+        tickets = [
+            Ticket.objects.create(title="VPN outage", description=description,
+                                  category=Ticket.CATEGORY_TECHNICAL, priority=Ticket.PRIORITY_HIGH)
+            for description in [OUTAGE_REPORT, OUTAGE_REPORT_COPY]
+        ]
+        deleted_id = tickets[1].pk
+        created = []
+        real_replace = os.replace
+
+        def replace_during_rebuild(source, destination):
+            # Another worker creates and deletes tickets just before the swap
+            created.append(Ticket.objects.create(title="Double charge", description=BILLING_REPORT,
+                                                 category=Ticket.CATEGORY_BILLING, priority=Ticket.PRIORITY_LOW))
+            tickets[1].delete()
+            real_replace(source, destination)
+
+        with mock.patch('os.replace', replace_during_rebuild):
+            call_command('rebuild_vector_index', stdout=StringIO())
+
+        index = vector_index.get_vector_index()
+        self.assertEqual(index.path.name, f"vectors.{index.dimensions}d.f32")
+        self.assertIsNotNone(index.vector(tickets[0].pk))
+        self.assertIsNotNone(index.vector(created[0].pk))
+        self.assertIsNone(index.vector(deleted_id))
+
+
+class FacetCountTests(TestCase):
+    """Tests for the faceted filter counts on the ticket list."""
+
+    @classmethod
+    def setUpTestData(cls):
+        rows = [
+            ("VPN down", "Cannot connect", Ticket.CATEGORY_TECHNICAL, Ticket.PRIORITY_HIGH, Ticket.STATUS_OPEN),
+            ("VPN slow", "Slow since 9am", Ticket.CATEGORY_TECHNICAL, Ticket.PRIORITY_LOW, Ticket.STATUS_RESOLVED),
+            ("Refund", "Charged 100% twice", Ticket.CATEGORY_BILLING, Ticket.PRIORITY_HIGH, Ticket.STATUS_OPEN),
+            ("Login", "Error in user_name field", Ticket.CATEGORY_ACCOUNT, Ticket.PRIORITY_MEDIUM, Ticket.STATUS_OPEN),
+        ]
+        Ticket.objects.bulk_create([
+            Ticket(title=title, description=description, category=category, priority=priority, status=status)
+            for title, description, category, priority, status in rows
+        ])
+
+    def test_unfiltered_counts_include_zeros(self):
+        facets = compute_facets({})
+
+        self.assertEqual(facets['category'], {
+            Ticket.CATEGORY_BILLING: 1, Ticket.CATEGORY_TECHNICAL: 2,
+            Ticket.CATEGORY_ACCOUNT: 1, Ticket.CATEGORY_GENERAL: 0,
+        })
+        self.assertEqual(facets['priority'][Ticket.PRIORITY_CRITICAL], 0)
+        self.assertEqual(facets['status'][Ticket.STATUS_CLOSED], 0)
+
+    def test_each_facet_ignores_its_own_filter(self):
+        facets = compute_facets({'category': Ticket.CATEGORY_TECHNICAL, 'status': Ticket.STATUS_OPEN})
+
+        # category counts apply the status filter only
+        self.assertEqual(facets['category'][Ticket.CATEGORY_TECHNICAL], 1)
+        self.assertEqual(facets['category'][Ticket.CATEGORY_BILLING], 1)
+        # status counts apply the category filter only
+        self.assertEqual(facets['status'][Ticket.STATUS_OPEN], 1)
+        self.assertEqual(facets['status'][Ticket.STATUS_RESOLVED], 1)
+        # priority counts apply both
+        self.assertEqual(facets['priority'], {
+            Ticket.PRIORITY_LOW: 0, Ticket.PRIORITY_MEDIUM: 0,
+            Ticket.PRIORITY_HIGH: 1, Ticket.PRIORITY_CRITICAL: 0,
+        })
+
+    def test_search_applies_to_every_facet(self):
+        facets = compute_facets({'priority': Ticket.PRIORITY_HIGH}, search='vpn')
+
+        self.assertEqual(facets['category'][Ticket.CATEGORY_TECHNICAL], 1)
+        self.assertEqual(facets['category'][Ticket.CATEGORY_BILLING], 0)
+        self.assertEqual(facets['priority'][Ticket.PRIORITY_LOW], 1)
+        self.assertEqual(facets['status'][Ticket.STATUS_OPEN], 1)
+        self.assertEqual(facets['status'][Ticket.STATUS_RESOLVED], 0)
+
+    def test_search_wildcards_match_literally(self):
+        # As wildcards, '%' would match every ticket and 's_r' would match "user"
+        percent = compute_facets({}, search='%')
+        underscore = compute_facets({}, search='user_name')
+        unmatched = compute_facets({}, search='s_r')
+
+        self.assertEqual(sum(percent['category'].values()), 1)
+        self.assertEqual(percent['category'][Ticket.CATEGORY_BILLING], 1)
+        self.assertEqual(underscore['category'], {
+            Ticket.CATEGORY_BILLING: 0, Ticket.CATEGORY_TECHNICAL: 0,
+            Ticket.CATEGORY_ACCOUNT: 1, Ticket.CATEGORY_GENERAL: 0,
+        })
+        self.assertEqual(sum(unmatched['category'].values()), 0)
+
+    def test_counts_match_the_list_for_every_choice(self):
+        client = APIClient()
+        params = {'status': Ticket.STATUS_OPEN, 'search': 'e'}
+        facets = client.get('/api/tickets/', {**params, 'facets': 1}).data['facets']
+
+        for facet, counts in facets.items():
+            for value, count in counts.items():
+                listed = client.get('/api/tickets/', {**params, facet: value}).data
+                self.assertEqual(len(listed), count, f"{facet}={value}")
+
+    def test_list_endpoint_returns_facets(self):
+        response = APIClient().get('/api/tickets/', {'facets': 1, 'status': Ticket.STATUS_OPEN})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual(response.data['facets']['status'][Ticket.STATUS_RESOLVED], 1)
+
+
+class ChooseEncodingTests(SimpleTestCase):
+    """Tests for Accept-Encoding negotiation."""
+
+    def test_prefers_brotli_on_ties(self):
+        self.assertEqual(choose_encoding('gzip, deflate, br'), 'br')
+
+    def test_q_values(self):
+        self.assertEqual(choose_encoding('br;q=0.5, gzip;q=0.8'), 'gzip')
+        self.assertEqual(choose_encoding('br;q=0, gzip'), 'gzip')
+        self.assertIsNone(choose_encoding('br;q=0, gzip;q=0'))
+
+    def test_wildcard(self):
+        self.assertEqual(choose_encoding('*'), 'br')
+        self.assertEqual(choose_encoding('*;q=0.5, br;q=0'), 'gzip')
+        self.assertIsNone(choose_encoding('gzip;q=0, *;q=0'))
+
+    def test_unsupported_or_missing(self):
+        self.assertIsNone(choose_encoding(''))
+        self.assertIsNone(choose_encoding('deflate, identity'))
+        self.assertIsNone(choose_encoding('gzip;q=abc'))
+
+    def test_gzip_only_without_brotli(self):
+        with mock.patch.object(middleware, 'BROTLI_AVAILABLE', False):
+            self.assertEqual(choose_encoding('br, gzip'), 'gzip')
+            self.assertIsNone(choose_encoding('br'))
+
+
+@override_settings(RESPONSE_COMPRESSION_MIN_BYTES=100)
+class CompressionMiddlewareTests(SimpleTestCase):
+    """Tests for CompressionMiddleware."""
+
+    body = b'{"title": "VPN outage", "status": "open"}' * 20
+
+    def get(self, content, accept_encoding='br, gzip', **headers):
+        response = HttpResponse(content, **headers)
+        request = APIRequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_compresses_large_responses(self):
+        response = self.get(self.body)
+
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertEqual(middleware.brotli.decompress(response.content), self.body)
+
+    def test_gzip(self):
+        response = self.get(self.body, accept_encoding='gzip')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.body)
+
+    def test_small_responses_are_left_alone(self):
+        response = self.get(b'{"ok": true}')
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertFalse(response.has_header('Vary'))
+        self.assertEqual(response.content, b'{"ok": true}')
+
+    def test_varies_even_when_client_accepts_no_coding(self):
+        response = self.get(self.body, accept_encoding='identity')
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response.content, self.body)
+
+    def test_already_encoded_responses_are_left_alone(self):
+        response = self.get(self.body, headers={'Content-Encoding': 'gzip'})
+
+        self.assertEqual(response.content, self.body)
+        self.assertFalse(response.has_header('Vary'))
+
+    def test_strong_etag_is_weakened(self):
+        response = self.get(self.body, headers={'ETag': '"abc"'})
+
+        self.assertEqual(response['ETag'], 'W/"abc"')
+
+
+class BodyFormatTests(SimpleTestCase):
+    """Tests for the orjson and MessagePack renderers and parsers."""
+
+    data = {'title': 'VPN outage', 'priority': 'high', 'tags': ['vpn', 'ünïcode'], 'count': 3}
+
+    def test_orjson_round_trip(self):
+        body = ORJSONRenderer().render(self.data)
+
+        self.assertEqual(ORJSONParser().parse(BytesIO(body)), self.data)
+
+    def test_orjson_parse_error(self):
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(BytesIO(b'{"title": '))
+
+    def test_msgpack_round_trip(self):
+        body = MessagePackRenderer().render(self.data)
+
+        self.assertEqual(MessagePackParser().parse(BytesIO(body)), self.data)
+
+    def test_msgpack_parse_error(self):
+        with self.assertRaises(ParseError):
+            MessagePackParser().parse(BytesIO(b'\xc1'))
+        with self.assertRaises(ParseError):
+            MessagePackParser().parse(BytesIO(b'\x92\x01'))
+
+    def test_empty_responses(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+        self.assertEqual(MessagePackRenderer().render(None), b'')
+
+
+class ClassifyThreadBudgetTests(SimpleTestCase):
+    """Tests for the check that classify calls cannot take every worker thread."""
+
+    def test_default_settings_leave_threads_free(self):
+        self.assertEqual(check_classify_thread_budget(None), [])
+
+    @override_settings(WORKER_THREADS=4, CLASSIFY_MAX_CONCURRENT=4,
+                       CLASSIFY_MAX_QUEUED_INTERACTIVE=0, CLASSIFY_MAX_QUEUED_BATCH=0)
+    def test_concurrency_equal_to_threads_is_an_error(self):
+        errors = check_classify_thread_budget(None)
+
+        self.assertEqual([error.id for error in errors], ['tickets.E001'])
+
+    @override_settings(WORKER_THREADS=8, CLASSIFY_MAX_CONCURRENT=2,
+                       CLASSIFY_MAX_QUEUED_INTERACTIVE=4, CLASSIFY_MAX_QUEUED_BATCH=2)
+    def test_queued_callers_count_against_threads(self):
+        self.assertEqual(len(check_classify_thread_budget(None)), 1)
+
+
+@override_settings(LLM_CLASSIFIER_BACKEND='tickets.services.llm_classifier.NullClassifier')
+class WorkerStartupTests(SimpleTestCase):
+    """Tests for lazy imports and the per-worker classifier warm-up."""
+
+    def setUp(self):
+        patcher = mock.patch.object(llm_classifier, '_classifier_instance', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_urlconf_import_skips_heavy_modules(self):
+        code = (
+            'import sys, django; django.setup(); import support_ticket_system.urls; '
+            'print(",".join(m for m in ("google.generativeai", "numpy") if m in sys.modules))'
+        )
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='support_ticket_system.settings')
+
+        result = subprocess.run([sys.executable, '-c', code], cwd=settings.BASE_DIR, env=env,
+                                capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), '')
+
+    def test_warm_up_builds_configured_backend(self):
+        llm_classifier.warm_up()
+
+        self.assertIsInstance(llm_classifier._classifier_instance, llm_classifier.NullClassifier)
+
+    @override_settings(LLM_WARMUP=False)
+    def test_warm_up_can_be_disabled(self):
+        llm_classifier.warm_up()
+
+        self.assertIsNone(llm_classifier._classifier_instance)
+
+    @override_settings(LLM_CLASSIFIER_BACKEND='tickets.services.missing.Classifier')
+    def test_warm_up_failure_is_logged_not_raised(self):
+        with self.assertLogs('tickets.services.llm_classifier', level='ERROR'):
+            llm_classifier.warm_up()
+
+        self.assertIsNone(llm_classifier._classifier_instance)
+
+    def test_gunicorn_hook_warms_up_each_worker(self):
+        config = runpy.run_path(str(settings.BASE_DIR / 'gunicorn.conf.py'))
+
+        config['post_worker_init'](mock.Mock())
+
+        self.assertIsInstance(llm_classifier._classifier_instance, llm_classifier.NullClassifier)
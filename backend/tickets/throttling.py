@@ -0,0 +1,172 @@
+"""
+Per-client token-bucket rate limiting and load-shedding errors for the API.
+
+Each client key gets a bucket of `burst` tokens refilled at `rate` tokens per
+second; a request spends one token or is rejected with 429 and a Retry-After
+telling the client when the next token will be available.
+
+Bucket state lives in a pluggable store: CacheTokenBucketStore keeps it in
+Django's cache so the limit is shared across worker processes, and
+LocalTokenBucketStore keeps it in process memory for tests.
+"""
+
+import logging
+import threading
+import time
+from typing import Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+
+class ClassifierBusy(APIException):
+    """
+    Raised when a classify call is shed by admission control.
+    """
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Classification service is busy. Please retry shortly.'
+    default_code = 'classifier_busy'
+
+    def __init__(self, wait, detail=None):
+        super().__init__(detail)
+        # DRF's exception handler turns this into a Retry-After header
+        self.wait = max(1, round(wait))
+
+
+def refill(tokens: float, updated_at: float, now: float, rate: float, burst: int) -> float:
+    """Return the token count after refilling from updated_at to now."""
+    return min(burst, tokens + max(0.0, now - updated_at) * rate)
+
+
+class LocalTokenBucketStore:
+    """
+    In-process token buckets; state is not shared between workers.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, cost: float = 1) -> Tuple[bool, float]:
+        """
+        Try to take `cost` tokens from the key's bucket.
+
+        Returns:
+            (allowed, retry_after seconds; 0 when allowed)
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated_at = self._buckets.get(key, (self.burst, now))
+            tokens = refill(tokens, updated_at, now, self.rate, self.burst)
+
+            if tokens >= cost:
+                self._buckets[key] = (tokens - cost, now)
+                return True, 0.0
+
+            self._buckets[key] = (tokens, now)
+            return False, (cost - tokens) / self.rate
+
+
+class CacheTokenBucketStore:
+    """
+    Token buckets in Django's cache, shared by every worker using that cache.
+
+    Django's cache API has no compare-and-swap, so each update holds a short
+    lock taken with cache.add() (atomic on every shared backend). If the lock
+    stays busy the request is rejected: contention on one bucket means that
+    client is already sending requests faster than it can be served.
+
+    Bucket state is only as durable as the cache. An entry that the cache
+    evicts (memory pressure in Redis, culling in DatabaseCache) comes back as
+    a full bucket, so the limit is best-effort rather than a hard guarantee.
+    """
+
+    LOCK_TIMEOUT = 2  # seconds; bounds how long a crashed worker can hold the lock
+    LOCK_ATTEMPTS = 10
+    LOCK_RETRY_DELAY = 0.005
+
+    def __init__(self, rate: float, burst: int, cache_alias: str = 'default'):
+        self.rate = rate
+        self.burst = burst
+        self.cache = caches[cache_alias]
+        # After this long untouched a bucket is full again, so its state can expire
+        self.state_timeout = int(burst / rate) + 60
+
+    def consume(self, key: str, cost: float = 1) -> Tuple[bool, float]:
+        """
+        Try to take `cost` tokens from the key's bucket.
+
+        Returns:
+            (allowed, retry_after seconds; 0 when allowed)
+        """
+        state_key = f"ratelimit:{key}"
+        lock_key = f"{state_key}:lock"
+
+        for _ in range(self.LOCK_ATTEMPTS):
+            if self.cache.add(lock_key, 1, timeout=self.LOCK_TIMEOUT):
+                break
+            time.sleep(self.LOCK_RETRY_DELAY)
+        else:
+            logger.warning(f"Rate limit bucket '{key}' is contended. Rejecting request.")
+            return False, cost / self.rate
+
+        try:
+            now = time.time()
+            tokens, updated_at = self.cache.get(state_key, (self.burst, now))
+            tokens = refill(tokens, updated_at, now, self.rate, self.burst)
+
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self.cache.set(state_key, (tokens, now), timeout=self.state_timeout)
+        finally:
+            self.cache.delete(lock_key)
+
+        return (True, 0.0) if allowed else (False, (cost - tokens) / self.rate)
+
+
+# Singleton instance
+_store_instance = None
+
+
+def get_rate_limit_store():
+    """Get or create the configured token-bucket store for classify calls."""
+    global _store_instance
+    if _store_instance is None:
+        backend = import_string(settings.CLASSIFY_RATE_LIMIT_BACKEND)
+        _store_instance = backend(
+            rate=settings.CLASSIFY_RATE_LIMIT_RATE,
+            burst=settings.CLASSIFY_RATE_LIMIT_BURST,
+        )
+    return _store_instance
+
+
+class ClassifyRateThrottle(BaseThrottle):
+    """
+    Token-bucket throttle keyed by client (user id when authenticated,
+    otherwise client IP). Rejected requests get 429 with Retry-After.
+    """
+
+    def __init__(self):
+        self.retry_after = None
+
+    def get_client_key(self, request):
+        """Identify the client a request counts against."""
+        if request.user and request.user.is_authenticated:
+            return f"classify:user:{request.user.pk}"
+        return f"classify:ip:{self.get_ident(request)}"
+
+    def allow_request(self, request, view):
+        allowed, self.retry_after = get_rate_limit_store().consume(self.get_client_key(request))
+        return allowed
+
+    def wait(self):
+        return self.retry_after
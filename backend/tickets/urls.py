@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import TicketViewSet, StatsView, ClassifyView
+from .views import TicketViewSet, StatsView, ResolutionStatsView, ClassifyView
 
 # Create a router for the ViewSet
 router = DefaultRouter()
@@ -9,6 +9,7 @@ router.register(r'tickets', TicketViewSet, basename='ticket')
 urlpatterns = [
     # Custom endpoints MUST come before router.urls to avoid conflicts
     path('tickets/stats/', StatsView.as_view(), name='ticket-stats'),
+    path('tickets/stats/resolution/', ResolutionStatsView.as_view(), name='ticket-stats-resolution'),
     path('tickets/classify/', ClassifyView.as_view(), name='ticket-classify'),
     
     # ViewSet routes (list, create, retrieve, update, destroy)
@@ -2,86 +2,247 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.db.models import Count, Q, Avg
+from django.db import transaction
+from django.db.models import Count, Avg
 from django.utils import timezone
 from datetime import timedelta
+from .filters import filter_tickets
 from .models import Ticket
+from .pagination import TicketPagination
 from .serializers import (
     TicketSerializer,
     TicketCreateSerializer,
     ClassifyRequestSerializer,
     ClassifyResponseSerializer,
-    StatsSerializer
+    DuplicateTicketSerializer,
+    SimilarTicketSerializer,
+    StatsSerializer,
+    ResolutionStatsSerializer
 )
 from .services.llm_classifier import get_classifier
+from .services.admission import AdmissionRejected, LANE_BATCH, LANE_INTERACTIVE, get_admission_controller
+from .throttling import ClassifierBusy, ClassifyRateThrottle
+from .services.facets import FACET_CHOICES, compute_facets
+from .services.status_events import record_status_changes, get_resolution_stats
+from .services.duplicates import compute_signature, find_duplicate_of, find_duplicates, index_ticket
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# The vector index needs NumPy, whose import is a large share of startup time;
+# every use goes through this so it is imported on first use, not at worker boot.
+def _vector_index():
+    """Return the vector index service module, importing it on first use."""
+    from .services import vector_index
+    return vector_index
+
+
 class TicketViewSet(viewsets.ModelViewSet):
     """
     ViewSet for Ticket CRUD operations with filtering and search.
     
     Endpoints:
     - GET /api/tickets/ - List all tickets with optional filters
+      (add ?facets=1 for per-value filter counts, ?limit=&offset=&count= to paginate)
     - POST /api/tickets/ - Create a new ticket
     - GET /api/tickets/{id}/ - Retrieve a specific ticket
-    - PATCH /api/tickets/{id}/ - Update a ticket
+    - PUT/PATCH /api/tickets/{id}/ - Update a ticket
     - DELETE /api/tickets/{id}/ - Delete a ticket
+    - POST /api/tickets/claim-next/ - Claim the most urgent open ticket
+    - GET /api/tickets/{id}/duplicates/ - List near-duplicates of a ticket
+    - GET /api/tickets/{id}/similar/?k=10 - List the most similar tickets
     """
     queryset = Ticket.objects.all()
     serializer_class = TicketSerializer
+    pagination_class = TicketPagination
     
     def get_queryset(self):
         """
         Filter tickets based on query parameters.
         Supports: category, priority, status, and search (title + description).
         """
-        queryset = Ticket.objects.all()
-        
-        # Filter by category
-        category = self.request.query_params.get('category', None)
-        if category:
-            queryset = queryset.filter(category=category)
-        
-        # Filter by priority
-        priority = self.request.query_params.get('priority', None)
-        if priority:
-            queryset = queryset.filter(priority=priority)
-        
-        # Filter by status
-        ticket_status = self.request.query_params.get('status', None)
-        if ticket_status:
-            queryset = queryset.filter(status=ticket_status)
-        
-        # Search in title and description
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
+        # The MinHash signature is only needed for duplicate detection
+        queryset = Ticket.objects.defer('minhash_signature')
+        
+        # The same filters are used for the facet counts (see tickets.filters)
+        params = self.request.query_params
+        queryset = filter_tickets(queryset, params, search=params.get('search'))
         
         return queryset.order_by('-created_at')  # Newest first
     
+    def list(self, request, *args, **kwargs):
+        """
+        List tickets. With ?facets=1 the response is wrapped as
+        {"results": [...], "facets": {...}} (or "facets" is added to the
+        paginated response) with per-value counts for category, priority and
+        status under the current search and filters.
+        """
+        response = super().list(request, *args, **kwargs)
+        
+        if request.query_params.get('facets') not in ('1', 'true'):
+            return response
+        
+        filters = {
+            facet: request.query_params.get(facet)
+            for facet in FACET_CHOICES
+            if request.query_params.get(facet)
+        }
+        facets = compute_facets(filters, search=request.query_params.get('search'))
+        if isinstance(response.data, dict):
+            # Paginated: add facets alongside count and results
+            response.data['facets'] = facets
+        else:
+            response.data = {
+                'results': response.data,
+                'facets': facets,
+            }
+        return response
+    
     def create(self, request, *args, **kwargs):
-        """Create a new ticket."""
+        """Create a new ticket, flagging it if it near-duplicates an earlier one."""
         serializer = TicketCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        # Create the ticket
-        ticket = Ticket.objects.create(**serializer.validated_data)
+        # Look up near-duplicates through the LSH buckets of the new signature
+        signature = compute_signature(serializer.validated_data['description'])
+        duplicate_of = find_duplicate_of(signature)
+        
+        # Create the ticket and its LSH buckets together
+        with transaction.atomic():
+            ticket = Ticket.objects.create(
+                **serializer.validated_data,
+                minhash_signature=signature,
+                duplicate_of=duplicate_of,
+            )
+            index_ticket(ticket)
+            transaction.on_commit(lambda: _vector_index().index_ticket_vector(ticket))
         
         # Return the created ticket
         response_serializer = TicketSerializer(ticket)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
     
-    def partial_update(self, request, *args, **kwargs):
-        """Update a ticket (e.g., change status, override category/priority)."""
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data, partial=True)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+    def perform_update(self, serializer):
+        """
+        Save an update (PUT or PATCH) and log any status transition.
+        
+        The row is re-read under a lock inside the transaction, so concurrent
+        updates and claim-next see each other's status changes and each
+        transition is recorded exactly once.
+        """
+        # A new description needs a new MinHash signature
+        extra_fields = {}
+        if 'description' in serializer.validated_data:
+            extra_fields['minhash_signature'] = compute_signature(serializer.validated_data['description'])
+        
+        with transaction.atomic():
+            serializer.instance = (
+                Ticket.objects
+                .select_for_update()
+                .defer('minhash_signature')
+                .get(pk=serializer.instance.pk)
+            )
+            previous_status = serializer.instance.status
+            ticket = serializer.save(**extra_fields)
+            record_status_changes([(ticket, previous_status)])
+            if extra_fields:
+                index_ticket(ticket)
+            if {'title', 'description'} & set(serializer.validated_data):
+                transaction.on_commit(lambda: _vector_index().index_ticket_vector(ticket))
+    
+    def perform_destroy(self, instance):
+        """Delete a ticket and drop it from the vector index."""
+        ticket_id = instance.pk
+        instance.delete()
+        _vector_index().remove_ticket_vector(ticket_id)
+    
+    @action(detail=True, methods=['get'])
+    def duplicates(self, request, pk=None):
+        """
+        List near-duplicates of a ticket, most similar first.
+        
+        Candidates come from the ticket's LSH buckets; each is checked
+        against the MinHash signature before being returned.
+        """
+        ticket = self.get_object()
+        matches = find_duplicates(ticket.minhash_signature, exclude_id=ticket.pk)
+        
+        # Matches only carry the columns used for comparison; load the rest in one query
+        rows = Ticket.objects.defer('minhash_signature').in_bulk([duplicate.pk for duplicate, _ in matches])
+        duplicates = []
+        for duplicate, score in matches:
+            duplicate = rows[duplicate.pk]
+            duplicate.similarity = round(score, 3)
+            duplicates.append(duplicate)
+        
+        serializer = DuplicateTicketSerializer(duplicates, many=True)
+        return Response(serializer.data)
+    
+    @action(detail=True, methods=['get'])
+    def similar(self, request, pk=None):
+        """
+        List the k tickets most similar to this one (default 10, max 100).
+        
+        Similarity is the cosine between hashed bag-of-words embeddings,
+        computed as a single matrix-vector product over the vector index.
+        """
+        ticket = self.get_object()
+        
+        try:
+            k = int(request.query_params.get('k', 10))
+        except ValueError:
+            return Response({'k': ['Must be an integer.']}, status=status.HTTP_400_BAD_REQUEST)
+        k = max(1, min(k, 100))
+        
+        vector_index = _vector_index()
+        index = vector_index.get_vector_index()
+        query = index.vector(ticket.pk)
+        if query is None:
+            # Not indexed yet (e.g. created before the index existed)
+            vector_index.index_ticket_vector(ticket)
+            query = index.vector(ticket.pk)
+        if query is None:
+            return Response([])
+        
+        matches = index.most_similar(query, k, exclude_id=ticket.pk)
+        scores = dict(matches)
+        tickets = Ticket.objects.defer('minhash_signature').in_bulk(list(scores))
+        
+        similar = []
+        for ticket_id, score in matches:
+            # Skip rows of tickets deleted since they were indexed
+            if ticket_id in tickets:
+                tickets[ticket_id].similarity = round(score, 3)
+                similar.append(tickets[ticket_id])
+        
+        serializer = SimilarTicketSerializer(similar, many=True)
+        return Response(serializer.data)
+    
+    @action(detail=False, methods=['post'], url_path='claim-next')
+    def claim_next(self, request):
+        """
+        Atomically claim the most urgent open ticket and move it to in_progress.
+        
+        Uses SELECT ... FOR UPDATE SKIP LOCKED over the open-ticket urgency
+        index, so concurrent agents never wait on each other and never claim
+        the same ticket. Returns 204 when the queue is empty.
+        """
+        with transaction.atomic():
+            ticket = (
+                Ticket.objects
+                .select_for_update(skip_locked=True)
+                .filter(status=Ticket.STATUS_OPEN)
+                .order_by(Ticket.URGENCY_ORDERING)
+                .first()
+            )
+            if ticket is None:
+                return Response(status=status.HTTP_204_NO_CONTENT)
+            
+            ticket.status = Ticket.STATUS_IN_PROGRESS
+            ticket.save(update_fields=['status'])
+            record_status_changes([(ticket, Ticket.STATUS_OPEN)])
+        
+        serializer = TicketSerializer(ticket)
         return Response(serializer.data)
 
 
@@ -157,6 +318,26 @@ class StatsView(APIView):
         return Response(serializer.data)
 
 
+class ResolutionStatsView(APIView):
+    """
+    API view for resolution-time metrics.
+    
+    Endpoint: GET /api/tickets/stats/resolution/
+    
+    Returns, for time-to-resolve and time spent in_progress, the count, mean
+    and p50/p90/p99 durations (in seconds) per category and per priority.
+    Values come from running aggregates maintained on every status change,
+    so the response time does not depend on history size.
+    """
+    
+    def get(self, request):
+        """Get resolution metrics from the precomputed aggregates."""
+        serializer = ResolutionStatsSerializer(data=get_resolution_stats())
+        serializer.is_valid(raise_exception=True)
+        
+        return Response(serializer.data)
+
+
 class ClassifyView(APIView):
     """
     API view for LLM-based ticket classification.
@@ -175,7 +356,14 @@ class ClassifyView(APIView):
     }
     
     Returns empty suggestions if LLM is unavailable or fails.
+    
+    Load protection:
+    - Per-client token bucket: 429 with Retry-After when a client exceeds its rate
+    - Bounded admission queue: 503 with Retry-After when the worker is saturated.
+      Requests sent with "X-Request-Priority: interactive" (the ticket form) are
+      admitted before batch callers.
     """
+    throttle_classes = [ClassifyRateThrottle]
     
     def post(self, request):
         """Classify a ticket description using LLM."""
@@ -188,8 +376,18 @@ class ClassifyView(APIView):
         # Get LLM classifier
         classifier = get_classifier()
         
-        # Classify the description
-        result = classifier.classify(description)
+        # Classify the description, shedding load if the worker is saturated
+        if request.headers.get('X-Request-Priority', '').lower() == LANE_INTERACTIVE:
+            lane = LANE_INTERACTIVE
+        else:
+            lane = LANE_BATCH
+        
+        try:
+            with get_admission_controller().admit(lane):
+                result = classifier.classify(description)
+        except AdmissionRejected as e:
+            logger.warning(f"Classify request shed ({e.reason}).")
+            raise ClassifierBusy(wait=e.retry_after)
         
         if result:
             # LLM classification succeeded
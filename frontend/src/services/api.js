@@ -65,7 +65,12 @@ export const getTicketStats = async () => {
  */
 export const classifyTicket = async (description) => {
   try {
-    const response = await apiClient.post('/api/tickets/classify/', { description });
+    // Interactive requests are admitted ahead of batch callers when the backend is busy
+    const response = await apiClient.post(
+      '/api/tickets/classify/',
+      { description },
+      { headers: { 'X-Request-Priority': 'interactive' } }
+    );
     // Map backend response (suggested_category) to frontend expectation (category)
     return {
       category: response.data.suggested_category,